@@ -1,5 +1,18 @@
-from app import AgroIndia
+import sys
 
 if __name__ == "__main__":
-    app = AgroIndia()
-    app.run()
+    if "--profile" in sys.argv:
+        from app.profiler import main
+
+        headless = "--headless" in sys.argv
+        sys.argv = [arg for arg in sys.argv if arg not in ("--profile", "--headless")]
+        main(headless=headless)
+    elif "--bundle" in sys.argv:
+        from app.i18n import main as bundle
+
+        bundle()
+    else:
+        from app import AgroIndia
+
+        app = AgroIndia()
+        app.run()
@@ -1,4 +1,15 @@
-from .app import AgroIndia
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import AgroIndia
+
+
+def __getattr__(name: str) -> Any:
+    # Imported lazily so lightweight submodules (e.g. ``app.profiler``) can load before kivy.
+    if name == "AgroIndia":
+        return __import__("app.app", fromlist=["AgroIndia"]).AgroIndia
+    raise AttributeError(f"module 'app' has no attribute {name!r}")
+
 
 __name__: str = "AgroIndia"  # type: ignore
 __version__: str = "0.0.1"
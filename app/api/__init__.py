@@ -1,2 +1,21 @@
+from typing import TYPE_CHECKING, Any
+
 from .base import Base
 from .models import Plant, Prices, Production, User
+
+if TYPE_CHECKING:
+    from .frame import PriceFrame
+    from .snapshot import PriceSnapshot
+
+
+def __getattr__(name: str) -> Any:
+    # both pull in numpy, and the snapshot sqlite, so they are only imported when first used
+    if name == "PriceFrame":
+        from .frame import PriceFrame
+
+        return PriceFrame
+    if name == "PriceSnapshot":
+        from .snapshot import PriceSnapshot
+
+        return PriceSnapshot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
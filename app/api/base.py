@@ -1,42 +1,100 @@
+import concurrent.futures
 import pathlib
+import threading
+from typing import TYPE_CHECKING, Any
 
-import requests
+from .cache import ResponseCache
+from .client import Client
 
-from .encyclopedia import Encyclopedia
-from .lens import Lens
-from .prices import Price
-from .production import Produce
-from .users import Members
-from .weather import Weather
+if TYPE_CHECKING:
+    from .encyclopedia import Encyclopedia
+    from .lens import Lens
+    from .prices import Price
+    from .production import Produce
+    from .snapshot import PriceSnapshot
+    from .users import Members
+    from .weather import Weather
 
 
 class Base:
 
-    users: Members
-    weather: Weather
-    lens: Lens
-    encyclopedia: Encyclopedia
-    prices: Price
-    production: Produce
+    users: "Members"
+    weather: "Weather"
+    lens: "Lens"
+    encyclopedia: "Encyclopedia"
+    prices: "Price"
+    production: "Produce"
+    client: Client
+    cache: ResponseCache
     EXTS: list[str] = ["users", "weather", "lens", "prices", "encyclopedia", "production"]
     PATH: pathlib.Path = pathlib.Path(__file__).parent
+    TTLS: dict[str, float] = {
+        "prices/filter": 3 * 60 * 60,
+        "produce/filter": 24 * 60 * 60,
+        "encyclopedia/search": 14 * 24 * 60 * 60,
+        "weather/daily": 30 * 60,
+    }
 
-    def __init__(self) -> None:
-        self.client = requests.Session()
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.cache = ResponseCache(self.TTLS)
+        self.client = Client(self.cache, path / "http.db" if path else None)
+        self.path = path
         self.base_url = "https://agroindia.herokuapp.com/api/v1"
+        self._snapshot: "PriceSnapshot | None" = None
+        self._lock = threading.RLock()
+        self._locks: dict[str, threading.Lock] = {}
+
+    @property
+    def snapshot(self) -> "PriceSnapshot | None":
+        """Offline copy of the prices table, opened on first use so numpy and sqlite stay out of startup."""
+        if self.path is None:
+            return None
+        with self._lock:
+            if self._snapshot is None:
+                from .snapshot import PriceSnapshot
+
+                self._snapshot = PriceSnapshot(self.path / "prices.db")
+        return self._snapshot
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when ``name`` is not set yet, i.e. the extension has not been imported.
+        if name not in self.EXTS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self.load_extension(f"app.api.{name}")
+        return self.__dict__[name]
 
     def load_extension(self, extension: str) -> None:
-        self.__dict__[extension.split(".")[-1]] = __import__(extension, fromlist=["add_ext"]).add_ext(
-            self.client, self.base_url
-        )
-        print(f"🔃 Loaded extension {extension.split('.')[-1]}")
+        name = extension.split(".")[-1]
+        # one lock per extension, so different extensions import concurrently and each is only built once
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name in self.__dict__:
+                return
+            ext = __import__(extension, fromlist=["add_ext"]).add_ext(self.client, self.base_url)
+            with self._lock:
+                self.__dict__[name] = ext
+        print(f"🔃 Loaded extension {name}")
         return
 
     def _load_extension(self) -> None:
-        for ext in self.PATH.iterdir():
-            if ext.name[:-3] in self.EXTS:
-                self.load_extension(f"app.api.{ext.name[:-3]}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.EXTS)) as pool:
+            for future in [pool.submit(self.load_extension, f"app.api.{ext}") for ext in self.EXTS]:
+                future.result()
+
+    def preload(self) -> threading.Thread:
+        """Import every extension concurrently on a background thread."""
+        thread = threading.Thread(target=self._load_extension, name="agroindia-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def run(self, preload: bool = False) -> None:
+        if preload:
+            self.preload()
+        return None
 
-    def run(self) -> None:
-        self._load_extension()
+    def close(self) -> None:
+        self.client.close()
+        if self._snapshot is not None:
+            self._snapshot.close()
         return None
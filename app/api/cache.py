@@ -0,0 +1,73 @@
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+__all__: tuple[str, ...] = ("ResponseCache",)
+
+
+class Entry(NamedTuple):
+    value: Any
+    expires: float
+
+
+class ResponseCache:
+    """Bounded LRU cache with per-endpoint time to live.
+
+    ``ttls`` maps an endpoint suffix (e.g. ``"prices/filter"``) to the number of seconds a response stays fresh.
+    Endpoints without a ttl are never cached.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, ttls: dict[str, float], maxsize: int = 256) -> None:
+        self.ttls = ttls
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: dict[str, str] | None = None) -> str:
+        query = sorted((k, str(v).strip()) for k, v in (params or {}).items() if v is not None and str(v).strip())
+        return f"{url.rstrip('/')}?{urllib.parse.urlencode(query)}"
+
+    def ttl(self, url: str) -> float | None:
+        path = urllib.parse.urlsplit(url).path.rstrip("/")
+        matches = [endpoint for endpoint in self.ttls if path.endswith(endpoint)]
+        return self.ttls[max(matches, key=len)] if matches else None
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = Entry(value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+        return None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._entries)
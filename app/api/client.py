@@ -0,0 +1,288 @@
+import asyncio
+import email.utils
+import hashlib
+import json
+import pathlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping
+
+import aiohttp
+import requests
+from aiohttp.abc import AbstractStreamWriter
+from kivy.logger import Logger
+
+from .cache import ResponseCache
+from .flight import SingleFlight
+
+if TYPE_CHECKING:
+    from .store import DiskCache
+
+__all__: tuple[str, ...] = (
+    "Client",
+    "Progress",
+    "Response",
+    "Source",
+    "Upload",
+)
+
+Source = bytes | memoryview | pathlib.Path
+Progress = Callable[[int, int], Any]
+
+
+@dataclass(frozen=True)
+class Response:
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class Upload(aiohttp.payload.Payload):
+    """Multipart file part streamed in fixed size chunks from memory or disk.
+
+    ``progress(sent, total)`` is called on the event loop after every chunk; a new instance starts over from zero, so a
+    retried upload re-reads ``source`` instead of buffering it.
+    """
+
+    CHUNK: int = 64 * 1024
+
+    def __init__(self, source: Source, progress: Progress | None = None, **kwargs: Any) -> None:
+        super().__init__(source, content_type="application/octet-stream", **kwargs)
+        self.source = source
+        self.progress = progress
+        self._size = source.stat().st_size if isinstance(source, pathlib.Path) else memoryview(source).nbytes
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("Uploads are binary")
+
+    def chunks(self) -> Iterator[bytes | memoryview]:
+        if isinstance(self.source, pathlib.Path):
+            with self.source.open("rb") as file:
+                while chunk := file.read(self.CHUNK):
+                    yield chunk
+            return
+        view = memoryview(self.source).cast("B")
+        for start in range(0, view.nbytes, self.CHUNK):
+            yield view[start : start + self.CHUNK]
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        sent = 0
+        for chunk in self.chunks():
+            await writer.write(chunk)
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self._size or sent)
+        return None
+
+
+class Client:
+    """Shared HTTP client used by every extension.
+
+    Blocking calls go through a pooled ``requests.Session``; awaitable calls go through a single
+    ``aiohttp.ClientSession`` living on one background event loop thread.
+    """
+
+    session: requests.Session
+    loop: asyncio.AbstractEventLoop | None = None
+    thread: threading.Thread | None = None
+    LIMIT: int = 8
+    RETRIES: int = 3
+    RETRY_STATUS: tuple[int, ...] = (502, 503, 504)
+
+    def __init__(self, cache: ResponseCache | None = None, path: pathlib.Path | None = None) -> None:
+        self.session = requests.Session()
+        self.cache = cache
+        self.path = path
+        self.flight = SingleFlight()
+        self._disk: "DiskCache | None" = None
+        self._aiosession: aiohttp.ClientSession | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def disk(self) -> "DiskCache | None":
+        """Persistent store at ``path``, created on first use so sqlite is not imported at startup."""
+        if self.path is None:
+            return None
+        with self._lock:
+            if self._disk is None:
+                from .store import DiskCache
+
+                self._disk = DiskCache(self.path)
+        return self._disk
+
+    @staticmethod
+    def params(params: dict[str, Any] | None) -> dict[str, str]:
+        return {k: str(v) for k, v in (params or {}).items() if v is not None and v != ""}
+
+    @staticmethod
+    def wrap(response: requests.Response) -> Response:
+        return Response(response.status_code, response.text, dict(response.headers))
+
+    def lookup(self, url: str, params: dict[str, str]) -> tuple[str | None, Response | None, dict[str, str]]:
+        """Return the cache key, a fresh cached response if any, and the headers for a conditional request."""
+        key, cached = self.recall(url, params)
+        if key is None or cached is not None:
+            return key, cached, {}
+        return (key, *self.restore(url, key))
+
+    def recall(self, url: str, params: dict[str, str]) -> tuple[str | None, Response | None]:
+        """The cache key of a cacheable request and its response if it is fresh in memory, never touches the disk."""
+        if self.cache is None or self.cache.ttl(url) is None:
+            return None, None
+        key = self.cache.key(url, params)
+        return key, self.cache.get(key)
+
+    def restore(self, url: str, key: str) -> tuple[Response | None, dict[str, str]]:
+        """A fresh response from the disk cache, or the headers to revalidate a stale one; blocks on SQLite."""
+        assert self.cache is not None
+        ttl = self.cache.ttl(url) or 0
+        record = self.disk.get(key) if self.disk is not None else None
+        if record is None:
+            return None, {}
+        if record.stored + ttl > time.time():
+            self.cache.set(key, record.response, record.stored + ttl - time.time())
+            return record.response, {}
+        # stored headers are a plain dict, servers differ in how they capitalise them
+        stored = {name.lower(): value for name, value in record.response.headers.items()}
+        headers = {}
+        if etag := stored.get("etag"):
+            headers["If-None-Match"] = etag
+        headers["If-Modified-Since"] = stored.get("last-modified", email.utils.formatdate(record.stored, usegmt=True))
+        return None, headers
+
+    def orphaned(self, key: str | None, headers: dict[str, str], response: Response) -> bool:
+        """Whether ``response`` is a 304 for a stored body that has been evicted since the request was sent."""
+        if not headers or response.status_code != 304 or key is None:
+            return False
+        return self.disk is None or self.disk.get(key) is None
+
+    def store(self, key: str | None, url: str, response: Response) -> Response:
+        if self.cache is None or key is None:
+            return response
+        if response.status_code == 304 and self.disk is not None and (record := self.disk.get(key)) is not None:
+            self.disk.touch(key)
+            response = record.response
+        elif response.status_code == 200 and self.disk is not None:
+            self.disk.set(key, response)
+        if response.status_code == 200:
+            self.cache.set(key, response, self.cache.ttl(url) or 0)
+        return response
+
+    @staticmethod
+    def fingerprint(stream: Source) -> str:
+        if not isinstance(stream, pathlib.Path):
+            return hashlib.sha1(stream).hexdigest()
+        sha = hashlib.sha1()
+        with stream.open("rb") as file:
+            while chunk := file.read(Upload.CHUNK):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    @classmethod
+    def digest(cls, url: str, files: Mapping[str, Source]) -> str:
+        return ResponseCache.key(url, {name: cls.fingerprint(stream) for name, stream in files.items()})
+
+    def get(self, url: str, params: dict[str, Any] | None = None, cache: bool = True) -> Response:
+        """GET ``url``, ``cache=False`` neither reads nor writes the response caches."""
+        query = self.params(params)
+        key, cached, headers = self.lookup(url, query) if cache else (None, None, {})
+        if cached is not None:
+            return cached
+        return self.flight.do(ResponseCache.key(url, query), lambda: self._get(url, query, key, headers))
+
+    def _get(self, url: str, query: dict[str, str], key: str | None, headers: dict[str, str]) -> Response:
+        response = self.wrap(self.session.get(url, params=query, headers=headers))
+        if self.orphaned(key, headers, response):
+            response = self.wrap(self.session.get(url, params=query))
+        return self.store(key, url, response)
+
+    def post(self, url: str, files: dict[str, bytes], key: str | None = None) -> Response:
+        return self.flight.do(key or self.digest(url, files), lambda: self.wrap(self.session.post(url, files=files)))
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.thread = threading.Thread(target=self.loop.run_forever, name="agroindia-aio", daemon=True)
+                self.thread.start()
+                print("🔃 Started async client loop")
+        return self.loop
+
+    async def aiosession(self) -> aiohttp.ClientSession:
+        if self._aiosession is None or self._aiosession.closed:
+            self._aiosession = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.LIMIT))
+        return self._aiosession
+
+    async def _aget(self, url: str, query: dict[str, str], key: str | None) -> Response:
+        # the disk cache is SQLite, its reads and writes run on the default executor to keep the loop free
+        loop = asyncio.get_running_loop()
+        headers: dict[str, str] = {}
+        if key is not None and self.path is not None:
+            cached, headers = await loop.run_in_executor(None, self.restore, url, key)
+            if cached is not None:
+                return cached
+        session = await self.aiosession()
+        async with session.get(url, params=query, headers=headers) as raw:
+            response = Response(raw.status, await raw.text(), dict(raw.headers))
+        if response.status_code == 304 and await loop.run_in_executor(None, self.orphaned, key, headers, response):
+            async with session.get(url, params=query) as raw:
+                response = Response(raw.status, await raw.text(), dict(raw.headers))
+        if key is None:
+            return response
+        return await loop.run_in_executor(None, self.store, key, url, response)
+
+    async def aget(self, url: str, params: dict[str, Any] | None = None, cache: bool = True) -> Response:
+        query = self.params(params)
+        key, cached = self.recall(url, query) if cache else (None, None)
+        if cached is not None:
+            return cached
+        return await self.flight.ado(ResponseCache.key(url, query), lambda: self._aget(url, query, key))
+
+    async def _upload(self, url: str, files: dict[str, Source], progress: Progress | None) -> Response:
+        session = await self.aiosession()
+        data = aiohttp.FormData()
+        for name, stream in files.items():
+            data.add_field(name, Upload(stream, progress), filename=name)
+        async with session.post(url, data=data) as response:
+            return Response(response.status, await response.text(), dict(response.headers))
+
+    async def _apost(self, url: str, files: dict[str, Source], progress: Progress | None = None) -> Response:
+        # one attempt and up to RETRIES retries, the last retry returns whatever it gets or raises
+        for attempt in range(self.RETRIES):
+            try:
+                response = await self._upload(url, files, progress)
+                if response.status_code not in self.RETRY_STATUS:
+                    return response
+                reason = f"status {response.status_code}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+                reason = repr(exception)
+            Logger.warning(f"Client: upload to {url} failed with {reason}, retry {attempt + 1}/{self.RETRIES}")
+            await asyncio.sleep(0.5 * 2**attempt)
+        return await self._upload(url, files, progress)
+
+    async def apost(
+        self, url: str, files: dict[str, Source], key: str | None = None, progress: Progress | None = None
+    ) -> Response:
+        """Stream ``files`` as a multipart upload.
+
+        Dropped connections and gateway errors are retried with backoff, for at most ``1 + RETRIES`` attempts.
+        """
+        return await self.flight.ado(key or self.digest(url, files), lambda: self._apost(url, files, progress))
+
+    async def aclose(self) -> None:
+        if self._aiosession is not None and not self._aiosession.closed:
+            await self._aiosession.close()
+        return None
+
+    def close(self) -> None:
+        self.session.close()
+        if self._disk is not None:
+            self._disk.close()
+        if self.loop is not None:
+            asyncio.run_coroutine_threadsafe(self.aclose(), self.loop).result(timeout=5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        return None
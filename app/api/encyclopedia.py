@@ -1,11 +1,12 @@
-import requests
+from typing import Any
 
+from .client import Client
 from .models import Plant
 
 
 class Encyclopedia:
 
-    client: requests.Session
+    client: Client
     CATEGORIES: tuple[str, ...] = (
         "kingdoms",
         "divisions",
@@ -15,19 +16,30 @@ class Encyclopedia:
         "genus",
     )
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(self, session: Client, base_url: str) -> None:
         self.client = session
         self.base_url = f"{base_url}/encyclopedia"
 
-    def get_encyclopedia(self, plant: str) -> Plant | dict:
-        response = self.client.get(f"{self.base_url}/search", params={"query": plant}).json()
+    @staticmethod
+    def parse(response: list[dict[str, Any]]) -> Plant | dict:
         res = list(sorted(response, key=lambda x: list(x.values()).count(None)))
         return Plant(**res[0]) if res else {}
 
+    def get_encyclopedia(self, plant: str) -> Plant | dict:
+        return self.parse(self.client.get(f"{self.base_url}/search", params={"query": plant}).json())
+
+    async def aget_encyclopedia(self, plant: str) -> Plant | dict:
+        response = await self.client.aget(f"{self.base_url}/search", params={"query": plant})
+        return self.parse(response.json())
+
     def get_info(self, category: str) -> dict[str, str]:
         response: dict[str, str] = self.client.get(f"{self.base_url}/{category}").json()
         return response
 
+    async def aget_info(self, category: str) -> dict[str, str]:
+        response: dict[str, str] = (await self.client.aget(f"{self.base_url}/{category}")).json()
+        return response
+
 
-def add_ext(session: requests.Session, base_url: str) -> Encyclopedia:
+def add_ext(session: Client, base_url: str) -> Encyclopedia:
     return Encyclopedia(session, base_url)
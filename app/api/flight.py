@@ -0,0 +1,76 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, TypeVar
+
+__all__: tuple[str, ...] = ("SingleFlight",)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one.
+
+    The first caller for a key runs the call, every caller that arrives while it is in flight waits on the same
+    future and receives the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, concurrent.futures.Future] = {}
+        self._tasks: dict[str, asyncio.Future] = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = concurrent.futures.Future()
+        if not leader:
+            result: T = future.result()
+            return result
+        try:
+            value = fn()
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaitable variant, must be called from the event loop that runs the shared task.
+
+        The shared request is only cancelled once every caller waiting on it has been cancelled, a caller arriving after
+        that starts a new one.
+        """
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            result: T = await asyncio.shield(task)
+            return result
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+                    self._forget(key, task)
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        return None
+
+    @property
+    def inflight(self) -> int:
+        return len(self._calls) + len(self._tasks)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._calls or key in self._tasks
@@ -0,0 +1,166 @@
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from .models import Prices
+
+__all__: tuple[str, ...] = (
+    "PriceFrame",
+    "parse_date",
+    "parse_day",
+)
+
+DATE_FORMATS: tuple[str, ...] = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y")
+
+
+def parse_date(value: str | date | None) -> np.datetime64:
+    if value is None or value == "":
+        return np.datetime64("NaT")
+    if isinstance(value, date):
+        return np.datetime64(value, "D")
+    for fmt in DATE_FORMATS:
+        try:
+            return np.datetime64(datetime.strptime(value, fmt).date(), "D")
+        except ValueError:
+            continue
+    return np.datetime64("NaT")
+
+
+def parse_day(value: str | date | None) -> str | None:
+    """``value`` as ``YYYY-MM-DD``, ``None`` if it is not a date."""
+    parsed = parse_date(value)
+    return None if np.isnat(parsed) else str(parsed)
+
+
+class PriceFrame:
+    """Column oriented, numpy backed set of price records.
+
+    Every column of :class:`Prices` is stored as one array (text columns as object arrays, prices as ``int64`` and the
+    arrival date additionally parsed into ``DATE`` as ``datetime64[D]``) so filters, sorting and aggregates over a
+    fetched result set run locally without another request.
+    """
+
+    COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(Prices))
+    TEXT: tuple[str, ...] = ("STATE", "DISTRICT", "MARKET", "COMMODITY", "VARIETY", "ARRIVAL_DATE")
+    NUMERIC: tuple[str, ...] = ("ID", "MIN_PRICE", "MAX_PRICE", "MODAL_PRICE")
+
+    def __init__(self, columns: dict[str, np.ndarray]) -> None:
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[Prices]) -> "PriceFrame":
+        rows = list(records)
+        columns: dict[str, np.ndarray] = {}
+        for name in cls.TEXT:
+            columns[name] = np.array([getattr(row, name) for row in rows], dtype=object)
+        for name in cls.NUMERIC:
+            columns[name] = np.fromiter((getattr(row, name) or 0 for row in rows), dtype=np.int64, count=len(rows))
+        columns["DATE"] = cls.dates(columns["ARRIVAL_DATE"])
+        return cls(columns)
+
+    @staticmethod
+    def dates(values: np.ndarray) -> np.ndarray:
+        # arrival dates repeat heavily, parse each distinct value once
+        unique, inverse = np.unique(values.astype(str), return_inverse=True)
+        parsed = np.array([parse_date(value) for value in unique], dtype="datetime64[D]")
+        return parsed[inverse] if len(values) else np.array([], dtype="datetime64[D]")
+
+    def __len__(self) -> int:
+        return len(self.columns["ID"])
+
+    def __getitem__(self, index: np.ndarray | slice) -> "PriceFrame":
+        return PriceFrame({name: column[index] for name, column in self.columns.items()})
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def records(self) -> list[Prices]:
+        values = [self.columns[name].tolist() for name in self.COLUMNS]
+        return [Prices(*row) for row in zip(*values)]
+
+    def mask(
+        self,
+        _id: int | None = None,
+        state: str | None = None,
+        district: str | None = None,
+        market: str | None = None,
+        commodity: str | None = None,
+        initial: int | None = None,
+        final: int | None = None,
+        since: str | date | None = None,
+        until: str | date | None = None,
+    ) -> np.ndarray:
+        mask = np.ones(len(self), dtype=bool)
+        if _id:
+            mask &= self.columns["ID"] == int(_id)
+        for name, value in (("STATE", state), ("DISTRICT", district), ("MARKET", market), ("COMMODITY", commodity)):
+            if value:
+                mask &= self.columns[name] == value
+        if initial:
+            mask &= self.columns["MODAL_PRICE"] >= int(initial)
+        if final:
+            mask &= self.columns["MODAL_PRICE"] <= int(final)
+        if since:
+            mask &= self.columns["DATE"] >= parse_date(since)
+        if until:
+            mask &= self.columns["DATE"] <= parse_date(until)
+        return mask
+
+    def filter(self, *args: Any, **kwargs: Any) -> "PriceFrame":
+        """Rows matching every given criterion, accepts the same arguments as :meth:`mask`."""
+        return self[self.mask(*args, **kwargs)]
+
+    def sort(self, column: str = "MODAL_PRICE", reverse: bool = False) -> "PriceFrame":
+        order = np.argsort(self.columns[column], kind="stable")
+        return self[order[::-1] if reverse else order]
+
+    def top(self, k: int, column: str = "MODAL_PRICE", largest: bool = True) -> "PriceFrame":
+        """The ``k`` rows with the largest (or smallest) ``column``, ordered best first."""
+        values = self.columns[column]
+        if k <= 0 or not len(values):
+            return self[np.array([], dtype=np.intp)]
+        k = min(k, len(values))
+        keys = -values if largest else values
+        index = np.argpartition(keys, k - 1)[:k]
+        return self[index[np.argsort(keys[index], kind="stable")]]
+
+    def groups(self, by: Sequence[str]) -> tuple[list[tuple[Any, ...]], np.ndarray]:
+        codes = np.zeros(len(self), dtype=np.int64)
+        uniques = []
+        for name in by:
+            unique, inverse = np.unique(self.columns[name], return_inverse=True)
+            codes = codes * len(unique) + inverse
+            uniques.append(unique)
+        keys, inverse = np.unique(codes, return_inverse=True)
+        labels = []
+        for code in keys.tolist():
+            label = []
+            for unique in reversed(uniques):
+                code, position = divmod(code, len(unique))
+                label.append(unique[position])
+            labels.append(tuple(reversed(label)))
+        return labels, inverse
+
+    def aggregate(self, by: Sequence[str] = ("MARKET", "COMMODITY")) -> list[dict[str, Any]]:
+        """Count, lowest minimum, highest maximum and mean modal price for every group of ``by``."""
+        if not len(self):
+            return []
+        labels, inverse = self.groups(by)
+        count = np.bincount(inverse, minlength=len(labels))
+        low = np.full(len(labels), np.iinfo(np.int64).max, dtype=np.int64)
+        high = np.full(len(labels), np.iinfo(np.int64).min, dtype=np.int64)
+        np.minimum.at(low, inverse, self.columns["MIN_PRICE"])
+        np.maximum.at(high, inverse, self.columns["MAX_PRICE"])
+        mean = np.bincount(inverse, weights=self.columns["MODAL_PRICE"], minlength=len(labels)) / count
+        return [
+            {
+                **dict(zip(by, label)),
+                "COUNT": int(count[i]),
+                "MIN_PRICE": int(low[i]),
+                "MAX_PRICE": int(high[i]),
+                "MODAL_PRICE": round(float(mean[i]), 2),
+            }
+            for i, label in enumerate(labels)
+        ]
@@ -1,24 +1,167 @@
+import asyncio
+import pathlib
+import threading
+from collections import OrderedDict
+from functools import cache
 from typing import Any
 
-import requests
+import numpy as np
+
+from .client import Client, Progress, Response, Source
+
+__all__: tuple[str, ...] = (
+    "Lens",
+    "decode",
+    "encode",
+    "from_texture",
+    "opencv",
+    "preprocess",
+    "resize",
+)
+
+# the identification models work on downscaled inputs, larger uploads only cost bandwidth
+MAX_SIDE: int = 1024
+QUALITY: int = 80
+
+
+@cache
+def opencv() -> Any:
+    import cv2
+
+    print("📷 Loaded opencv")
+    return cv2
+
+
+def from_texture(pixels: bytes, width: int, height: int) -> np.ndarray:
+    """BGR image from the RGBA ``pixels`` of a texture, whose origin is at the bottom left."""
+    rgba = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 4)[::-1]
+    cv2 = opencv()
+    image: np.ndarray = cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR)
+    return image
+
+
+def decode(data: bytes) -> np.ndarray:
+    """BGR image from encoded ``data``, EXIF orientation is applied and every other bit of metadata dropped."""
+    cv2 = opencv()
+    image: np.ndarray | None = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Unsupported image")
+    return image
+
+
+def resize(image: np.ndarray, side: int = MAX_SIDE) -> np.ndarray:
+    """Downscale ``image`` so its longest side is at most ``side``, smaller images are returned as is."""
+    height, width = np.shape(image)[:2]
+    scale = side / max(height, width)
+    if scale >= 1:
+        return image
+    cv2 = opencv()
+    resized: np.ndarray = cv2.resize(
+        image, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA
+    )
+    return resized
+
+
+def encode(image: np.ndarray, quality: int = QUALITY, ext: str = ".jpg") -> bytes:
+    """Encode ``image`` in memory as JPEG or, with ``ext=".webp"``, WebP."""
+    cv2 = opencv()
+    flag = cv2.IMWRITE_WEBP_QUALITY if ext == ".webp" else cv2.IMWRITE_JPEG_QUALITY
+    ok, buffer = cv2.imencode(ext, image, [flag, quality])
+    if not ok:
+        raise ValueError(f"Could not encode image as {ext}")
+    return bytes(buffer)
+
+
+def preprocess(source: bytes | pathlib.Path, side: int = MAX_SIDE, quality: int = QUALITY, ext: str = ".jpg") -> bytes:
+    """Decode, downscale and re-encode an image before upload, blocks so call it off the main thread."""
+    data = source.read_bytes() if isinstance(source, pathlib.Path) else source
+    return encode(resize(decode(data), side), quality, ext)
 
 
 class Lens:
+    """Plant identification and health assessment uploads.
 
-    client: requests.Session
+    Results are cached per ``(image hash, mode)``, so tapping identify and diagnose on the same photo, or picking the
+    same photo again, uploads it at most once per mode. :meth:`aanalyse` runs both uploads concurrently from one
+    payload.
+    """
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    client: Client
+    MODES: tuple[str, ...] = ("identify", "diagnose")
+
+    def __init__(self, session: Client, base_url: str, maxsize: int = 32) -> None:
         self.client = session
         self.base_url = f"{base_url}/upload"
+        self.maxsize = maxsize
+        self.results: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(stream: Source) -> str:
+        return Client.fingerprint(stream)
+
+    def cached(self, digest: str, mode: str) -> dict[str, Any] | None:
+        with self._lock:
+            result = self.results.get((digest, mode))
+            if result is not None:
+                self.results.move_to_end((digest, mode))
+            return result
+
+    def store(self, digest: str, mode: str, response: Response) -> dict[str, Any]:
+        result: dict[str, Any] = response.json()
+        if response.status_code == 200:
+            with self._lock:
+                self.results[(digest, mode)] = result
+                while len(self.results) > self.maxsize:
+                    self.results.popitem(last=False)
+        return result
+
+    def upload(self, mode: str, stream: bytes, digest: str | None = None) -> dict[str, Any]:
+        digest = digest or self.digest(stream)
+        if (result := self.cached(digest, mode)) is not None:
+            return result
+        url = f"{self.base_url}/{mode}"
+        return self.store(digest, mode, self.client.post(url, files={"file": stream}, key=f"{url}:{digest}"))
+
+    async def aupload(
+        self, mode: str, stream: Source, digest: str | None = None, progress: Progress | None = None
+    ) -> dict[str, Any]:
+        digest = digest or self.digest(stream)
+        if (result := self.cached(digest, mode)) is not None:
+            return result
+        url = f"{self.base_url}/{mode}"
+        response = await self.client.apost(url, files={"file": stream}, key=f"{url}:{digest}", progress=progress)
+        return self.store(digest, mode, response)
 
     def identify(self, stream: bytes) -> dict[str, Any]:
-        response: dict[str, Any] = self.client.post(f"{self.base_url}/identify", files={"file": stream}).json()
-        return response
+        return self.upload("identify", stream)
+
+    async def aidentify(self, stream: Source, progress: Progress | None = None) -> dict[str, Any]:
+        return await self.aupload("identify", stream, progress=progress)
 
     def diagnose(self, stream: bytes) -> dict[str, Any]:
-        response: dict[str, Any] = self.client.post(f"{self.base_url}/diagnose", files={"file": stream}).json()
-        return response
+        return self.upload("diagnose", stream)
+
+    async def adiagnose(self, stream: Source, progress: Progress | None = None) -> dict[str, Any]:
+        return await self.aupload("diagnose", stream, progress=progress)
+
+    async def aanalyse(self, stream: Source, progress: Progress | None = None) -> dict[str, dict[str, Any]]:
+        """Identify and diagnose ``stream`` concurrently, hashing it once; returns the results keyed by mode."""
+        digest = self.digest(stream)
+        sent: dict[str, tuple[int, int]] = {}
+
+        def report(mode: str) -> Progress:
+            def update(done: int, total: int) -> None:
+                sent[mode] = (done, total)
+                if progress is not None:
+                    progress(sum(done for done, _ in sent.values()), sum(total for _, total in sent.values()))
+                return None
+
+            return update
+
+        results = await asyncio.gather(*(self.aupload(mode, stream, digest, report(mode)) for mode in self.MODES))
+        return dict(zip(self.MODES, results))
 
 
-def add_ext(session: requests.Session, base_url: str) -> Lens:
+def add_ext(session: Client, base_url: str) -> Lens:
     return Lens(session, base_url)
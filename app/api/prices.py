@@ -1,16 +1,47 @@
-import requests
+import asyncio
+from typing import TYPE_CHECKING, Any
 
+from .client import Client, Response
 from .models import Prices
 
+if TYPE_CHECKING:
+    from .snapshot import PriceSnapshot
+
 
 class Price:
 
-    client: requests.Session
+    client: Client
+    # upper bound on the pages of one pull, a server that never runs out of pages leaves the snapshot incomplete
+    PAGES: int = 1000
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(self, session: Client, base_url: str) -> None:
         self.client = session
         self.base_url = f"{base_url}/prices"
 
+    @staticmethod
+    def params(
+        _id: int | None = None,
+        state: str | None = None,
+        district: str | None = None,
+        market: str | None = None,
+        commodity: str | None = None,
+        initial: int | None = None,
+        final: int | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "id": _id if _id else None,
+            "state": state if state else None,
+            "district": district if district else None,
+            "market": market if market else None,
+            "commodity": commodity if commodity else None,
+            "initial": initial if initial else None,
+            "final": final if final else None,
+        }
+
+    @staticmethod
+    def parse(response: list[dict[str, Any]]) -> list[Prices]:
+        return list(sorted([Prices(**res) for res in response], key=lambda x: x.MODAL_PRICE))
+
     def get_price(
         self,
         _id: int | None = None,
@@ -21,20 +52,81 @@ class Price:
         initial: int | None = None,
         final: int | None = None,
     ) -> list[Prices]:
-        response = self.client.get(
-            f"{self.base_url}/filter",
-            params={  # type: ignore
-                "id": _id if _id else None,
-                "state": state if state else None,
-                "district": district if district else None,
-                "market": market if market else None,
-                "commodity": commodity if commodity else None,
-                "initial": initial if initial else None,
-                "final": final if final else None,
-            },
-        )
-        return list(sorted([Prices(**res) for res in response.json()], key=lambda x: x.MODAL_PRICE))
-
-
-def add_ext(session: requests.Session, base_url: str) -> Price:
+        params = self.params(_id, state, district, market, commodity, initial, final)
+        return self.parse(self.client.get(f"{self.base_url}/filter", params=params).json())
+
+    async def aget_price(
+        self,
+        _id: int | None = None,
+        state: str | None = None,
+        district: str | None = None,
+        market: str | None = None,
+        commodity: str | None = None,
+        initial: int | None = None,
+        final: int | None = None,
+    ) -> list[Prices]:
+        params = self.params(_id, state, district, market, commodity, initial, final)
+        return self.parse((await self.client.aget(f"{self.base_url}/filter", params=params)).json())
+
+    @staticmethod
+    def page(response: Response, seen: set[int]) -> list[dict[str, Any]] | None:
+        """Rows of one page of the table, ``None`` if it repeats rows of an earlier page."""
+        if response.status_code != 200:
+            raise ValueError(f"Price table page failed with status {response.status_code}")
+        rows: list[dict[str, Any]] = response.json()
+        # a server that ignores ``page``, or a table that shifted under the pull, repeats rows: the pull can't be trusted
+        if any(row["ID"] in seen for row in rows):
+            return None
+        seen.update(row["ID"] for row in rows)
+        return rows
+
+    def table(self) -> tuple[list[Prices], bool]:
+        """Every row of ``prices/filter`` page by page, and whether an empty or short page ended the table.
+
+        The pages bypass the response caches, they are only ever stored in the snapshot.
+        """
+        rows: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        first = 0
+        for number in range(1, self.PAGES + 1):
+            response = self.client.get(f"{self.base_url}/filter", params={"page": number}, cache=False)
+            if (page := self.page(response, seen)) is None:
+                break
+            rows.extend(page)
+            first = first or len(page)
+            if len(page) < first or not page:
+                return self.parse(rows), True
+        return self.parse(rows), False
+
+    async def atable(self) -> tuple[list[Prices], bool]:
+        rows: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        first = 0
+        for number in range(1, self.PAGES + 1):
+            response = await self.client.aget(f"{self.base_url}/filter", params={"page": number}, cache=False)
+            if (page := self.page(response, seen)) is None:
+                break
+            rows.extend(page)
+            first = first or len(page)
+            if len(page) < first or not page:
+                return self.parse(rows), True
+        return self.parse(rows), False
+
+    def pull(self, snapshot: "PriceSnapshot", force: bool = False) -> int:
+        """Download the whole price table into ``snapshot`` when it is stale, returns the number of changed rows."""
+        if not force and not snapshot.stale():
+            return 0
+        return snapshot.merge(*self.table())
+
+    async def apull(self, snapshot: "PriceSnapshot", force: bool = False) -> int:
+        if not force and not snapshot.stale():
+            return 0
+        return await self.client.flight.ado(f"pull:{snapshot.path}", lambda: self._apull(snapshot))
+
+    async def _apull(self, snapshot: "PriceSnapshot") -> int:
+        records, complete = await self.atable()
+        return await asyncio.get_running_loop().run_in_executor(None, snapshot.merge, records, complete)
+
+
+def add_ext(session: Client, base_url: str) -> Price:
     return Price(session, base_url)
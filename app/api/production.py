@@ -1,35 +1,37 @@
-from typing import Literal
-
-import requests
+from typing import Any, Literal
 
+from .client import Client
 from .models import Production
 
 
 class Produce:
 
-    client: requests.Session
+    client: Client
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(self, session: Client, base_url: str) -> None:
         self.client = session
         self.base_url = f"{base_url}/produce"
 
-    def get_produce(
-        self, crop: str | None = None, frequency: Literal["Rabi", "Kharif"] | None = None, avg: float | None = None
-    ) -> list[Production]:
-        response = self.client.get(
-            f"{self.base_url}/filter",
-            params={  # type: ignore
-                "crop": crop or None,
-                "frequency": frequency or None,
-                "avg": avg or None,
-            },
-        )
+    @staticmethod
+    def parse(response: Any) -> list[Production]:
         try:
-            items = [Production(*list(res.values())) for res in response.json()]
+            items = [Production(*list(res.values())) for res in response]
             return sorted(items, key=lambda x: sum([value.PRODUCE for value in x.VALUES]), reverse=True)
         except AttributeError:
             return []
 
+    def get_produce(
+        self, crop: str | None = None, frequency: Literal["Rabi", "Kharif"] | None = None, avg: float | None = None
+    ) -> list[Production]:
+        params = {"crop": crop or None, "frequency": frequency or None, "avg": avg or None}
+        return self.parse(self.client.get(f"{self.base_url}/filter", params=params).json())
+
+    async def aget_produce(
+        self, crop: str | None = None, frequency: Literal["Rabi", "Kharif"] | None = None, avg: float | None = None
+    ) -> list[Production]:
+        params = {"crop": crop or None, "frequency": frequency or None, "avg": avg or None}
+        return self.parse((await self.client.aget(f"{self.base_url}/filter", params=params)).json())
+
 
-def add_ext(session: requests.Session, base_url: str) -> Produce:
+def add_ext(session: Client, base_url: str) -> Produce:
     return Produce(session, base_url)
@@ -0,0 +1,167 @@
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+from .frame import PriceFrame, parse_day
+from .models import Prices
+
+__all__: tuple[str, ...] = ("PriceSnapshot",)
+
+
+class PriceSnapshot:
+    """Local copy of the whole prices table backed by SQLite.
+
+    Rows are upserted by ``ID`` and only written when a column actually changed, so repeated syncs of an unchanged
+    table cost a single read. A complete pull also drops the rows the server no longer has, an incomplete one leaves
+    the snapshot marked as such and it should not be queried in place of the server. Queries use the same criteria as
+    ``prices/filter`` and are answered from indexed columns without touching the network.
+    """
+
+    COLUMNS: tuple[str, ...] = PriceFrame.COLUMNS
+    INTERVAL: float = 6 * 60 * 60
+    SCHEMA: tuple[str, ...] = (
+        """
+        CREATE TABLE IF NOT EXISTS prices (
+            ID INTEGER PRIMARY KEY,
+            STATE TEXT NOT NULL,
+            DISTRICT TEXT NOT NULL,
+            MARKET TEXT NOT NULL,
+            COMMODITY TEXT NOT NULL,
+            VARIETY TEXT NOT NULL,
+            ARRIVAL_DATE TEXT NOT NULL,
+            MIN_PRICE INTEGER NOT NULL,
+            MAX_PRICE INTEGER NOT NULL,
+            MODAL_PRICE INTEGER NOT NULL,
+            DAY TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS prices_location ON prices (STATE, DISTRICT, MARKET)",
+        "CREATE INDEX IF NOT EXISTS prices_commodity ON prices (COMMODITY)",
+        "CREATE INDEX IF NOT EXISTS prices_day ON prices (DAY)",
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    )
+
+    def __init__(self, path: pathlib.Path, interval: float = INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._open = threading.Lock()
+        self._count: int | None = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # opened once under its own lock, the sync worker and the price screen can reach it at the same time
+        with self._open:
+            if self._db is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                with db:
+                    for statement in self.SCHEMA:
+                        db.execute(statement)
+                self._db = db
+            return self._db
+
+    def meta(self, key: str) -> str | None:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else str(row[0])
+
+    @property
+    def synced(self) -> float:
+        with self._lock:
+            return float(self.meta("synced") or 0)
+
+    @property
+    def complete(self) -> bool:
+        """Whether the last pull saw the whole table."""
+        with self._lock:
+            return self.meta("complete") == "1"
+
+    def stale(self) -> bool:
+        return time.time() - self.synced > self.interval
+
+    def __len__(self) -> int:
+        if self._count is None:
+            with self._lock:
+                self._count = int(self.db.execute("SELECT COUNT(*) FROM prices").fetchone()[0])
+        return self._count
+
+    @staticmethod
+    def day(value: str) -> str | None:
+        return parse_day(value)
+
+    def merge(self, records: Iterable[Prices], complete: bool = True) -> int:
+        """Upsert ``records``, returns the number of rows that were added, changed or removed.
+
+        ``complete`` means ``records`` is the whole table, rows missing from it are deleted.
+        """
+        rows = [
+            (*(getattr(record, name) for name in self.COLUMNS), self.day(record.ARRIVAL_DATE)) for record in records
+        ]
+        columns = (*self.COLUMNS, "DAY")
+        updates = ", ".join(f"{name} = excluded.{name}" for name in columns[1:])
+        changed = " OR ".join(f"{name} IS NOT excluded.{name}" for name in columns[1:])
+        with self._lock, self.db:
+            before = self.db.total_changes
+            self.db.executemany(
+                f"INSERT INTO prices ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT (ID) DO UPDATE SET {updates} WHERE {changed}",
+                rows,
+            )
+            count = self.db.total_changes - before
+            if complete:
+                self.db.execute("CREATE TEMP TABLE IF NOT EXISTS pulled (ID INTEGER PRIMARY KEY)")
+                self.db.executemany("INSERT OR IGNORE INTO pulled VALUES (?)", ((row[0],) for row in rows))
+                count += self.db.execute("DELETE FROM prices WHERE ID NOT IN (SELECT ID FROM pulled)").rowcount
+                self.db.execute("DELETE FROM pulled")
+            self.db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [("synced", str(time.time())), ("complete", "1" if complete else "0")],
+            )
+            self._count = None
+        print(f"🔃 Synced {count} price records{'' if complete else ', the table is incomplete'}")
+        return count
+
+    def query(
+        self,
+        _id: int | None = None,
+        state: str | None = None,
+        district: str | None = None,
+        market: str | None = None,
+        commodity: str | None = None,
+        initial: int | None = None,
+        final: int | None = None,
+    ) -> list[Prices]:
+        """Records matching the same criteria as ``prices/filter``, ordered by modal price."""
+        clauses: list[str] = []
+        args: list[str | int] = []
+        for name, value in (("STATE", state), ("DISTRICT", district), ("MARKET", market), ("COMMODITY", commodity)):
+            if value:
+                clauses.append(f"{name} = ?")
+                args.append(value)
+        if _id:
+            clauses.append("ID = ?")
+            args.append(int(_id))
+        if initial:
+            clauses.append("MODAL_PRICE >= ?")
+            args.append(int(initial))
+        if final:
+            clauses.append("MODAL_PRICE <= ?")
+            args.append(int(final))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self.db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM prices {where} ORDER BY MODAL_PRICE, ID", args
+            ).fetchall()
+        return [Prices(*row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock, self._open:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        return None
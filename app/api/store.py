@@ -0,0 +1,105 @@
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from .client import Response
+
+__all__: tuple[str, ...] = ("DiskCache",)
+
+
+class Record(NamedTuple):
+    response: Response
+    stored: float
+
+
+class DiskCache:
+    """Persistent response store backed by SQLite.
+
+    Writes are transactional and the database runs in WAL mode, so a crash can lose at most the response being
+    written, never the file. ``maxsize`` caps the total body size in bytes; the least recently used rows are evicted.
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            body TEXT NOT NULL,
+            headers TEXT NOT NULL,
+            stored REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """
+
+    def __init__(self, path: pathlib.Path, maxsize: int = 16 * 1024 * 1024) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._open = threading.Lock()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # opened once under its own lock, callers already hold ``_lock`` while they use the connection
+        with self._open:
+            if self._db is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                with db:
+                    db.execute(self.SCHEMA)
+                self._db = db
+            return self._db
+
+    def get(self, key: str) -> Record | None:
+        with self._lock, self.db:
+            row = self.db.execute(
+                "SELECT status, body, headers, stored FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+        return Record(Response(row[0], row[1], json.loads(row[2])), row[3])
+
+    def set(self, key: str, response: Response) -> None:
+        now = time.time()
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, response.text, json.dumps(response.headers), now, now, len(response.text)),
+            )
+            self.evict()
+        return None
+
+    def touch(self, key: str) -> None:
+        now = time.time()
+        with self._lock, self.db:
+            self.db.execute("UPDATE responses SET stored = ?, accessed = ? WHERE key = ?", (now, now, key))
+        return None
+
+    def evict(self) -> None:
+        total: int = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.maxsize:
+            return None
+        for key, size in self.db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.maxsize:
+                break
+        return None
+
+    def clear(self) -> None:
+        with self._lock, self.db:
+            self.db.execute("DELETE FROM responses")
+        return None
+
+    def close(self) -> None:
+        with self._lock, self._open:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        return None
@@ -1,15 +1,14 @@
 import json
 
-import requests
-
+from .client import Client, Response
 from .models import User
 
 
 class Members:
 
-    client: requests.Session
+    client: Client
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(self, session: Client, base_url: str) -> None:
         self.client = session
         self.base_url = f"{base_url}/register"
 
@@ -17,16 +16,31 @@ class Members:
         response = self.client.get(f"{self.base_url}/info", params={"phone_number": phone})
         return User(**response.json())
 
+    async def aget_user(self, phone: int) -> User:
+        response = await self.client.aget(f"{self.base_url}/info", params={"phone_number": phone})
+        return User(**response.json())
+
     def get_message(self, phone: int) -> list[str]:
-        response: list[str] = self.client.get(f"{self.base_url}/get_messages", params={"phone_number": phone}).json()["messages"]
+        response: list[str] = self.client.get(f"{self.base_url}/get_messages", params={"phone_number": phone}).json()[
+            "messages"
+        ]
         return response
 
+    async def aget_message(self, phone: int) -> list[str]:
+        response = await self.client.aget(f"{self.base_url}/get_messages", params={"phone_number": phone})
+        messages: list[str] = response.json()["messages"]
+        return messages
+
     def seen_message(self, phone: int) -> bool:
         response = self.client.get(f"{self.base_url}/seen_message", params={"phone_number": phone})
         return response.status_code == 200
 
+    async def aseen_message(self, phone: int) -> bool:
+        response = await self.client.aget(f"{self.base_url}/seen_message", params={"phone_number": phone})
+        return response.status_code == 200
+
     @staticmethod
-    def extract(response: requests.Response) -> str:
+    def extract(response: Response) -> str:
         try:
             details = json.loads(response.text)["detail"]
         except json.decoder.JSONDecodeError:
@@ -34,13 +48,19 @@ class Members:
         return str(details[0]["msg"]) if isinstance(details, list) else str(details)
 
     def login(self, phone: int, password: str) -> tuple[bool, str | User]:
-        response = self.client.get(
-            f"{self.base_url}/login", params={"phone_number": phone, "password": password}  # type: ignore
-        )
+        response = self.client.get(f"{self.base_url}/login", params={"phone_number": phone, "password": password})
         if response.status_code != 200:
             return False, self.extract(response)
         return True, self.get_user(phone)
 
+    async def alogin(self, phone: int, password: str) -> tuple[bool, str | User]:
+        response = await self.client.aget(
+            f"{self.base_url}/login", params={"phone_number": phone, "password": password}
+        )
+        if response.status_code != 200:
+            return False, self.extract(response)
+        return True, await self.aget_user(phone)
+
     def register(self, phone: int, name: str, password: str, state: str, district: str) -> tuple[bool, str | User]:
         response = self.client.get(
             f"{self.base_url}/register",
@@ -50,7 +70,24 @@ class Members:
                 "password": password,
                 "state": state,
                 "district": district,
-            },  # type: ignore
+            },
+        )
+        if response.status_code != 200:
+            return False, self.extract(response)
+        return True, User(**response.json())
+
+    async def aregister(
+        self, phone: int, name: str, password: str, state: str, district: str
+    ) -> tuple[bool, str | User]:
+        response = await self.client.aget(
+            f"{self.base_url}/register",
+            params={
+                "phone_number": phone,
+                "name": name,
+                "password": password,
+                "state": state,
+                "district": district,
+            },
         )
         if response.status_code != 200:
             return False, self.extract(response)
@@ -59,7 +96,16 @@ class Members:
     def update_password(self, phone: int, old_password: str, new_password: str) -> tuple[bool, str | User]:
         response = self.client.get(
             f"{self.base_url}/update_password",
-            params={"phone_number": phone, "old_password": old_password, "new_password": new_password},  # type: ignore
+            params={"phone_number": phone, "old_password": old_password, "new_password": new_password},
+        )
+        if response.status_code != 200:
+            return False, self.extract(response)
+        return True, User(**response.json())
+
+    async def aupdate_password(self, phone: int, old_password: str, new_password: str) -> tuple[bool, str | User]:
+        response = await self.client.aget(
+            f"{self.base_url}/update_password",
+            params={"phone_number": phone, "old_password": old_password, "new_password": new_password},
         )
         if response.status_code != 200:
             return False, self.extract(response)
@@ -68,7 +114,16 @@ class Members:
     def update_location(self, phone: int, state: str, district: str) -> tuple[bool, str | User]:
         response = self.client.get(
             f"{self.base_url}/update_location",
-            params={"phone_number": phone, "state": state, "district": district},  # type: ignore
+            params={"phone_number": phone, "state": state, "district": district},
+        )
+        if response.status_code != 200:
+            return False, self.extract(response)
+        return True, User(**response.json())
+
+    async def aupdate_location(self, phone: int, state: str, district: str) -> tuple[bool, str | User]:
+        response = await self.client.aget(
+            f"{self.base_url}/update_location",
+            params={"phone_number": phone, "state": state, "district": district},
         )
         if response.status_code != 200:
             return False, self.extract(response)
@@ -78,14 +133,26 @@ class Members:
         res: dict[str, list[str]] = self.client.get(f"{self.base_url}/reigons").json()
         return res
 
+    async def aparams(self) -> dict[str, list[str]]:
+        res: dict[str, list[str]] = (await self.client.aget(f"{self.base_url}/reigons")).json()
+        return res
+
     def markets(self) -> dict[str, list[str]]:
         res: dict[str, list[str]] = self.client.get(f"{self.base_url}/markets").json()
         return res
 
+    async def amarkets(self) -> dict[str, list[str]]:
+        res: dict[str, list[str]] = (await self.client.aget(f"{self.base_url}/markets")).json()
+        return res
+
     def delete_user(self, phone: int) -> bool:
         response = self.client.get(f"{self.base_url}/delete_user", params={"phone_number": phone})
         return response.status_code == 200
 
+    async def adelete_user(self, phone: int) -> bool:
+        response = await self.client.aget(f"{self.base_url}/delete_user", params={"phone_number": phone})
+        return response.status_code == 200
+
 
-def add_ext(session: requests.Session, base_url: str) -> Members:
+def add_ext(session: Client, base_url: str) -> Members:
     return Members(session, base_url)
@@ -1,26 +1,46 @@
-import requests
+import asyncio
+
+from .client import Client
 
 
 class Weather:
 
-    client: requests.Session
+    client: Client
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(self, session: Client, base_url: str) -> None:
         self.client = session
         self.base_url = f"{base_url}/weather"
 
-    def forecast(self, phone: int, locations: str = None) -> tuple[list[dict], str]:
+    @staticmethod
+    def params(phone: int, locations: str | None = None, day: str | None = None) -> dict[str, str | int]:
         params: dict[str, str | int] = (
             {"phonenumber": phone} if locations is None else {"phonenumber": phone, "location": locations}
         )
-        response = self.client.get(f"{self.base_url}/forecast", params=params)
-        return response.json()["locations"], response.json()["reslovedAddress"]
+        return params if day is None else {**params, "date": day}
+
+    @staticmethod
+    def parse_timeline(response: dict) -> dict[str, list[dict]]:
+        data = response["locations"]
+        return {"description": data["description"], "timeline": data["hours"], "alerts": data["alerts"]}
+
+    def forecast(self, phone: int, locations: str = None) -> tuple[list[dict], str]:
+        response = self.client.get(f"{self.base_url}/forecast", params=self.params(phone, locations)).json()
+        return response["locations"], response["reslovedAddress"]
+
+    async def aforecast(self, phone: int, locations: str = None) -> tuple[list[dict], str]:
+        response = (await self.client.aget(f"{self.base_url}/forecast", params=self.params(phone, locations))).json()
+        return response["locations"], response["reslovedAddress"]
 
     def history(self, phone: int, locations: str = None) -> list[dict]:
-        params: dict[str, str | int] = (
-            {"phonenumber": phone} if locations is None else {"phonenumber": phone, "location": locations}
-        )
-        response: dict[str, list[dict]] = self.client.get(f"{self.base_url}/history", params=params).json()
+        response: dict[str, list[dict]] = self.client.get(
+            f"{self.base_url}/history", params=self.params(phone, locations)
+        ).json()
+        return response["locations"]
+
+    async def ahistory(self, phone: int, locations: str = None) -> list[dict]:
+        response: dict[str, list[dict]] = (
+            await self.client.aget(f"{self.base_url}/history", params=self.params(phone, locations))
+        ).json()
         return response["locations"]
 
     def cumulative(self, phone: int, locations: str = None) -> tuple[list[dict], str]:
@@ -28,22 +48,28 @@ class Weather:
         data2 = self.history(phone, locations)
         return data2 + data1[1:], info1
 
+    async def acumulative(self, phone: int, locations: str = None) -> tuple[list[dict], str]:
+        (data1, info1), data2 = await asyncio.gather(self.aforecast(phone, locations), self.ahistory(phone, locations))
+        return data2 + data1[1:], info1
+
     def timeline(self, phone: int, locations: str = None) -> dict[str, list[dict]]:
-        params: dict[str, str | int] = (
-            {"phonenumber": phone} if locations is None else {"phonenumber": phone, "location": locations}
-        )
-        response = self.client.get(f"{self.base_url}/timeline", params=params)
-        data = response.json()["locations"]
-        return {"description": data["description"], "timeline": data["hours"], "alerts": data["alerts"]}
+        response = self.client.get(f"{self.base_url}/timeline", params=self.params(phone, locations))
+        return self.parse_timeline(response.json())
+
+    async def atimeline(self, phone: int, locations: str = None) -> dict[str, list[dict]]:
+        response = await self.client.aget(f"{self.base_url}/timeline", params=self.params(phone, locations))
+        return self.parse_timeline(response.json())
 
     def daily(self, phone: int, location: str | None = None, day: str | None = None) -> dict:
-        params: dict[str, str | int] = (
-            {"phonenumber": phone} if location is None else {"phonenumber": phone, "location": location}
-        )
-        params = params if day is None else {**params, "date": day}
-        response: dict = self.client.get(f"{self.base_url}/daily", params=params).json()
+        response: dict = self.client.get(f"{self.base_url}/daily", params=self.params(phone, location, day)).json()
+        return response
+
+    async def adaily(self, phone: int, location: str | None = None, day: str | None = None) -> dict:
+        response: dict = (
+            await self.client.aget(f"{self.base_url}/daily", params=self.params(phone, location, day))
+        ).json()
         return response
 
 
-def add_ext(session: requests.Session, base_url: str) -> Weather:
+def add_ext(session: Client, base_url: str) -> Weather:
     return Weather(session, base_url)
@@ -1,22 +1,23 @@
 import json
 import pathlib
 import random
-from functools import cache
 from typing import Any, Callable
 
-from deep_translator import GoogleTranslator
 from kivy.base import ExceptionHandler, ExceptionManager, Logger
 from kivy.clock import Clock
 from kivy.core.audio import SoundLoader
-from kivy.uix.screenmanager import ScreenManager
+from kivy.properties import NumericProperty
+from kivy.uix.screenmanager import Screen, ScreenManager
 from kivymd.app import MDApp
+from kivymd.toast import toast
 from kivymd.uix.button import MDFlatButton
 from kivymd.uix.dialog import MDDialog
+from kivymd.uix.progressbar import MDProgressBar
 from kivymd.uix.spinner import MDSpinner
 
 from app.api import Base, User
 from app.gui import Render
-from app.utils import COLORS, LANGUAGES, PALETTE
+from app.utils import COLORS, LANGUAGES, PALETTE, Scheduler, TranslationStore, Translator
 
 
 class AgroIndiaExceptionHandler(ExceptionHandler):
@@ -30,48 +31,62 @@ class AgroIndia(MDApp):
 
     render: Render
     api: Base
+    tasks: Scheduler
+    screen: Screen | None = None
     data: dict[str, str]
     user: User
     loading: MDDialog
-    translator: GoogleTranslator
+    loading_text: str
+    bar: MDProgressBar | None = None
+    translator: Translator
     theme_color: tuple
     about_dialog: MDDialog
-    player: Any
-    translations: dict[str, dict[str, str]]
+    player: Any = None
     langs: dict[str, str] = LANGUAGES
     path: pathlib.Path = pathlib.Path(__file__).parent / ".data"
+    revision = NumericProperty(0)
 
     def __init__(self, **kwargs: str) -> None:
         super().__init__(**kwargs)
         self.render = Render()
-        self.api = Base()
+        self.api = Base(self.path)
+        self.tasks = Scheduler(self.api.client, error=self.fail)
         self.setup()
         self.lang = self.data["language"]
-        self.translator = GoogleTranslator(source="auto", target=self.lang)
+        self.translator = Translator(
+            TranslationStore(self.path / "translation.db", legacy=self.path / "translation.json"),
+            self.tasks,
+            ready=self.retranslate,
+        )
         self.sound = True
 
     def change_lang(self, lang: str) -> None:
         self.lang = lang
-        self.translator = GoogleTranslator(source="auto", target=self.lang)
+        self.retranslate()
         return None
 
-    @cache
     def translate(self, text: str, dest: str = None) -> str:
-        dest = dest or self.lang
-        if self.translations.get(dest, {}).get(text):
-            return self.translations[dest][text]
-        translated: str = self.translator.translate(text, target=dest) if dest != "en" else text
-        self.translations.setdefault(dest, {})[text] = translated
-        return translated
+        return self.translator.get(text, dest or self.lang)
+
+    def retranslate(self) -> None:
+        self.revision += 1
+        return None
+
+    def fbind(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        # kv rules calling app.translate(...) watch "translate", re-evaluate them whenever translations land
+        return super().fbind("revision" if name == "translate" else name, func, *args, **kwargs)
+
+    def funbind(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return super().funbind("revision" if name == "translate" else name, func, *args, **kwargs)
+
+    def unbind_uid(self, name: str, uid: int) -> Any:
+        return super().unbind_uid("revision" if name == "translate" else name, uid)
 
     def setup(self) -> None:
         if not self.path.exists():
             self.path.mkdir()
         if not (self.path / "users.json").exists():
             (self.path / "users.json").write_text('{"language": "en"}')
-        if not (self.path / "translation.json").exists():
-            (self.path / "translation.json").write_text("{}")
-        self.translations = json.loads((self.path / "translation.json").read_text())
         self.data = json.loads((self.path / "users.json").read_text())
         self.api.run()
         ExceptionManager.add_handler(AgroIndiaExceptionHandler())
@@ -86,7 +101,10 @@ class AgroIndia(MDApp):
         self.theme_color = (0, 0, 0, 1) if self.theme_cls.theme_style == "Dark" else (1, 1, 1, 1)
         return None
 
-    def loader(self, text: str) -> None:
+    def loader(self, text: str, progress: bool = False) -> None:
+        if hasattr(self, "loading"):
+            self.loading.dismiss()
+        self.bar = MDProgressBar(value=0, max=100, size_hint_y=None, height=4) if progress else None
         spinner = MDSpinner(
             size=(30, 30),
             size_hint=(None, None),
@@ -94,10 +112,11 @@ class AgroIndia(MDApp):
             determinate_time=0.5,
             active=True,
         )
+        self.loading_text = text
         self.loading = MDDialog(
             title=text,
             auto_dismiss=False,
-            content_cls=spinner,
+            content_cls=spinner if self.bar is None else self.bar,
             radius=[20, 7, 20, 7],
             type="custom",
             size_hint=(0.4, 0.1),
@@ -105,17 +124,44 @@ class AgroIndia(MDApp):
         self.loading.open()
         return None
 
+    def progress(self, sent: int, total: int) -> None:
+        """Show upload progress in the loader, safe to call from any thread."""
+        Clock.schedule_once(lambda _dt: self.set_progress(sent, total))
+        return None
+
+    def set_progress(self, sent: int, total: int) -> None:
+        if self.bar is None:
+            return None
+        percent = 100 * sent // max(total, 1)
+        self.bar.value = percent
+        self.loading.title = f"{self.loading_text} {percent}%"
+        return None
+
     def deload(self, callback: Callable = None, *args: Any) -> None:
         if callback:
             callback(*args)
         self.loading.dismiss()
         return None
 
+    def fail(self, exception: BaseException) -> None:
+        Logger.exception(exception)
+        if hasattr(self, "loading"):
+            self.loading.dismiss()
+        toast(self.translate("Something went wrong, please try again"))
+        return None
+
+    def on_screen(self, _manager: ScreenManager, screen: Screen) -> None:
+        if self.screen is not None and self.tasks.cancel(self.screen) and hasattr(self, "loading"):
+            self.loading.dismiss()
+        self.screen = screen
+        return None
+
     def on_stop(self) -> None:
+        self.tasks.shutdown()
+        self.api.close()
+        self.translator.store.close()
         with open(self.path / "users.json", "w") as f:
             json.dump(self.data, f, indent=4)
-        with open(self.path / "translation.json", "w") as f:
-            json.dump(self.translations, f, indent=4)
         return None
 
     def close_dialog(self) -> None:
@@ -140,15 +186,21 @@ class AgroIndia(MDApp):
     def random_sound(self) -> None:
         path = pathlib.Path(__file__).parent / "assets" / "audio"
         self.player = SoundLoader.load(str(random.choice(list(path.glob("*.mp3")))))
-        self.player.play()
+        if self.player is not None:
+            self.player.play()
         return None
 
     def randomize(self) -> None:
         self.random_sound()
+        # no audio provider, e.g. a machine without a sound device
+        if self.player is None:
+            return None
         Clock.schedule_once(lambda x: self.randomize(), self.player.length)
+        return None
 
     def set_volume(self, volume: float) -> None:
-        self.player.volume = volume / 100
+        if self.player is not None:
+            self.player.volume = volume / 100
         return None
 
     def set_sound(self) -> None:
@@ -157,6 +209,8 @@ class AgroIndia(MDApp):
         return None
 
     def music(self) -> None:
+        if self.player is None:
+            return None
         match self.sound:
             case True:
                 self.player.play()
@@ -168,7 +222,9 @@ class AgroIndia(MDApp):
         self.icon = "app/assets/icon.png"
         self.generate_theme()
         self.randomize()
-        return self.render.render()
+        screens = self.render.render()
+        screens.bind(current_screen=self.on_screen)
+        return screens
 
     @property
     def font_black(self) -> str:
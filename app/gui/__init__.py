@@ -1,2 +1,2 @@
-from .helpers import Settings, SliverToolbar
+from .helpers import DropdownMenu, MenuField, Settings, SliverToolbar, TypeAhead
 from .render import Render
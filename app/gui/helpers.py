@@ -1,6 +1,8 @@
-from threading import Thread
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable
 
+from kivy.logger import Logger
+from kivy.metrics import dp
 from kivy.uix.popup import Popup
 from kivy.uix.screenmanager import Screen
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -10,7 +12,7 @@ from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.toolbar import MDTopAppBar
 from kivymd.uix.transition import MDSlideTransition
 
-from app.utils import STATES, BlockLabel
+from app.utils import Autocomplete, BlockLabel, Priority, reference
 
 if TYPE_CHECKING:
     from app import AgroIndia
@@ -32,6 +34,143 @@ class SliverToolbar(MDTopAppBar):
         self.elevation = 10
 
 
+class DropdownMenu(MDDropdownMenu):
+    """Dropdown shared by every field showing the same kind of data.
+
+    Item lists are built once per data ``source`` and swapped into the existing recycle view, the height is capped so
+    only the visible rows get item views.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("width_mult", 4)
+        kwargs.setdefault("position", "auto")
+        kwargs.setdefault("max_height", dp(320))
+        super().__init__(**kwargs)
+        self.callback: Callable[[str], Any] | None = None
+        self.source: Hashable = None
+        self.sources: dict[Hashable, list[dict[str, Any]]] = {}
+
+    def load(self, source: Hashable, names: Iterable[str], selectable: bool = True) -> None:
+        if source == self.source:
+            return None
+        if source not in self.sources:
+            self.sources[source] = [
+                {
+                    "viewclass": "OneLineListItem",
+                    "text": name,
+                    "on_release": (lambda x=name: self.select(x)) if selectable else self.dismiss,
+                }
+                for name in names
+            ]
+        self.items = self.sources[source]
+        self.source = source
+        return None
+
+    def show(self, caller: Any, callback: Callable[[str], Any]) -> None:
+        self.caller = caller
+        self.callback = callback
+        if self.parent is None:
+            self.open()
+        return None
+
+    def select(self, name: str) -> None:
+        callback = self.callback
+        self.dismiss()
+        if callback is not None:
+            callback(name)
+        return None
+
+
+@cache
+def dropdown(kind: str) -> DropdownMenu:
+    return DropdownMenu()
+
+
+class MenuField:
+    """A field's handle on the shared ``kind`` dropdown, a drop-in for an ``MDDropdownMenu`` bound to that field."""
+
+    def __init__(self, kind: str, caller: Any, callback: Callable[[str], Any]) -> None:
+        self.kind = kind
+        self.caller = caller
+        self.callback = callback
+        self.source: Hashable = None
+        self.names: Iterable[str] = ()
+        self.selectable = True
+
+    def load(self, source: Hashable, names: Iterable[str]) -> "MenuField":
+        self.source, self.names, self.selectable = source, names, True
+        return self
+
+    def hint(self, text: str) -> "MenuField":
+        self.source, self.names, self.selectable = ("hint", text), (text,), False
+        return self
+
+    def open(self) -> None:
+        menu = dropdown(self.kind)
+        menu.load(self.source, self.names, self.selectable)
+        menu.show(self.caller, self.callback)
+        return None
+
+    def dismiss(self) -> None:
+        menu = dropdown(self.kind)
+        if menu.caller is self.caller:
+            menu.dismiss()
+        return None
+
+
+class TypeAhead:
+    """Suggestion menu for a text field listing only the best ``limit`` matches of ``index`` for its text.
+
+    Exposes ``open`` and ``dismiss`` so it can stand in for an ``MDDropdownMenu`` bound to the same field.
+    """
+
+    def __init__(
+        self, field: Any, index: Autocomplete, callback: Callable[[str], Any], limit: int = 8, **kwargs: Any
+    ) -> None:
+        self.field = field
+        self.index = index
+        self.callback = callback
+        self.limit = limit
+        self.selecting = False
+        self.menu = MDDropdownMenu(caller=field, items=[], width_mult=4, position="auto", **kwargs)
+        field.bind(text=self.on_text)
+
+    def items(self, text: str) -> list[dict[str, Any]]:
+        return [
+            {"viewclass": "OneLineListItem", "text": name, "on_release": lambda x=name: self.select(x)}
+            for name in self.index.search(text, self.limit)
+        ]
+
+    def on_text(self, field: Any, text: str) -> None:
+        if field.focus and not self.selecting:
+            self.open()
+        return None
+
+    def open(self) -> None:
+        self.menu.items = self.items(self.field.text)
+        if not self.menu.items:
+            return self.dismiss()
+        if self.menu.parent is None:
+            self.menu.open()
+            return None
+        self.menu.set_menu_properties()
+        self.menu.menu.size = (self.menu.target_width, self.menu.target_height)
+        return None
+
+    def select(self, name: str) -> None:
+        self.selecting = True
+        try:
+            self.callback(name)
+        finally:
+            self.selecting = False
+        return self.dismiss()
+
+    def dismiss(self) -> None:
+        if self.menu.parent is not None:
+            self.menu.dismiss()
+        return None
+
+
 class SwitchPassword(MDBoxLayout):
     ...
 
@@ -39,67 +178,29 @@ class SwitchPassword(MDBoxLayout):
 class SwitchLocation(MDBoxLayout):
     def __init__(self) -> None:
         super(SwitchLocation, self).__init__()
-        self.state_menu = MDDropdownMenu(
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": state,
-                    "on_release": lambda x=state: self.set_state(x),
-                }
-                for state in STATES
-            ],
-            width_mult=4,
-            caller=self.ids.state,
-            position="auto",
-        )
-        self.district_menu = MDDropdownMenu(
-            items=[{"viewclass": "OneLineListItem", "text": "Select a state first"}],
-            width_mult=4,
-            caller=self.ids.district,
-            position="auto",
-        )
+        self.state_menu = MenuField("states", self.ids.state, self.set_state).load("states", reference().states)
+        self.district_menu = MenuField("districts", self.ids.district, self.set_district).hint("Select a state first")
 
     def set_state(self, state: str) -> None:
-        self.state_menu.dismiss()
         self.ids.state.text = state
-        self.district_menu.items = [
-            {
-                "viewclass": "OneLineListItem",
-                "text": district,
-                "on_release": lambda x=district: self.set_district(x),
-            }
-            for district in STATES[state]
-        ]
+        self.district_menu.load(("districts", state), reference().districts_of(state))
         return None
 
     def set_district(self, district: str) -> None:
-        self.district_menu.dismiss()
         self.ids.district.text = district
         return None
 
 
 class Settings(Screen):
 
-    langs: MDDropdownMenu
+    langs: MenuField
     popup: Popup
     dialog: MDDialog
-    state_menu: MDDropdownMenu
-    distric_menu: MDDropdownMenu
 
     def set_lang(self, app: "AgroIndia") -> None:
-        self.langs = MDDropdownMenu(
-            caller=self.ids.language,
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": lang,
-                    "on_release": lambda x=lang: self.set_language(x, app),
-                }
-                for lang in app.langs
-            ],
-            width_mult=4,
-            position="auto",
-        )
+        if not hasattr(self, "langs"):
+            self.langs = MenuField("languages", self.ids.language, lambda lang: self.set_language(lang, app))
+            self.langs.load("languages", app.langs)
         self.langs.open()
         return None
 
@@ -107,14 +208,18 @@ class Settings(Screen):
         state = self.dialog.content_cls.ids.state.text
         district = self.dialog.content_cls.ids.district.text
         self.dialog.dismiss()
-        if state not in STATES:
+        if not reference().has_state(state):
             self.display_invalid_signup("Invalid State", "Invalid state selected", app)
             return None
-        if district not in STATES[state]:
+        if not reference().has_district(state, district):
             self.display_invalid_signup("Invalid District", "Invalid district selected", app)
             return None
         self.display_invalid_signup("Location Changed", "Restart app to apply changes", app)
-        Thread(target=app.api.users.update_location, args=(app.user.phone, state, district)).start()
+        app.tasks.submit(
+            app.api.users.aupdate_location(app.user.phone, state, district),
+            error=lambda exception: Logger.exception(exception),
+            priority=Priority.BACKGROUND,
+        )
         return None
 
     def change_location(self, app: "AgroIndia") -> None:
@@ -145,7 +250,11 @@ class Settings(Screen):
         if len(new) < 8:
             self.display_invalid_signup("Invalid Password", "Password must be at least 8 characters long", app)
             return None
-        Thread(target=app.api.users.update_password, args=(app.user.phone, old, new)).start()
+        app.tasks.submit(
+            app.api.users.aupdate_password(app.user.phone, old, new),
+            error=lambda exception: Logger.exception(exception),
+            priority=Priority.BACKGROUND,
+        )
         self.display_invalid_signup("Password Changed", "Your password has been changed", app)
         return None
 
@@ -179,7 +288,11 @@ class Settings(Screen):
         return None
 
     def delacc(self, app: "AgroIndia") -> None:
-        app.api.users.delete_user(app.user.phone)
+        app.tasks.submit(
+            app.api.users.adelete_user(app.user.phone),
+            error=lambda exception: Logger.exception(exception),
+            priority=Priority.BACKGROUND,
+        )
         self.manager.transition = MDSlideTransition(direction="right")
         self.manager.current = "login"
         self.display_invalid_signup("Account Deleted", "Your account has been deleted", app)
@@ -1,54 +1,68 @@
 import csv
 import os
-import typing
+import pathlib
+from dataclasses import astuple
 from datetime import datetime, timedelta
-from threading import Thread
 from typing import TYPE_CHECKING, Any
 
-from kivy.clock import Clock, mainthread
+from kivy.graphics.texture import Texture
+from kivy.logger import Logger
 from kivy.metrics import dp
+from kivy.properties import ListProperty, NumericProperty, StringProperty
 from kivy.uix.image import AsyncImage
 from kivy.uix.screenmanager import Screen
 from kivymd.toast import toast
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDFlatButton
-from kivymd.uix.datatables import MDDataTable
 from kivymd.uix.dialog import MDDialog
 from kivymd.uix.filemanager import MDFileManager
 from kivymd.uix.label import MDLabel
-from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.pickers import MDDatePicker
-from matplotlib import pyplot as plt
 
 from app.api import Plant, Prices
 from app.api import Production as ProductionModel
-from app.utils import CROPS, MARKETS, STATES, HoverButton, HoverRectangle, Plot, Report
+from app.gui.helpers import MenuField, TypeAhead
+from app.utils import (
+    Chart,
+    HoverButton,
+    HoverRectangle,
+    Priority,
+    Report,
+    TableModel,
+    Task,
+    cached_texture,
+    reference,
+    render_production,
+    upload,
+)
 
 if TYPE_CHECKING:
     from app import AgroIndia
+    from app.api import PriceFrame
 
 
 class Production(Screen):
     data: list[ProductionModel]
-    crops: MDDropdownMenu
-    seasons: MDDropdownMenu
-
-    def draw_graphs(self) -> None:
-        for i in range(len(self.ids.swiper.get_items())):
-            self.ids.swiper.remove_widget(self.ids.swiper.get_items()[0])
-        plt.style.use("seaborn")
-        for num, crop in enumerate(self.data):
-            years = {value.YEAR: value.PRODUCE for value in crop.VALUES if value.PRODUCE}
-            plt.bar(years.keys(), years.values(), color="yellow", edgecolor="black")
-            plt.plot(years.keys(), years.values(), color="red", marker="o")
-            plt.title(f"{crop.CROP}")
-            plt.xlabel("Years")
-            plt.ylabel(f"Production in {crop.UNIT}")
-            plt.legend(["Production", "Trend"])
-            self.ids.swiper.add_widget(Plot(plt.gcf()))
-            plt.close()
-            if num == 10:
-                break
+    crops: TypeAhead
+    seasons: MenuField
+
+    def draw_graphs(self, app: "AgroIndia") -> None:
+        self.ids.swiper.viewclass = lambda: Chart(lambda chart, crop: self.load_graph(chart, crop, app))
+        self.ids.swiper.data = self.data
+        return None
+
+    def load_graph(self, chart: Chart, crop: ProductionModel, app: "AgroIndia") -> None:
+        if (texture := cached_texture(crop)) is not None:
+            chart.show(crop, texture)
+            return None
+        app.tasks.submit(
+            lambda: render_production(crop),
+            lambda raster: chart.show(crop, upload(raster)),
+            error=lambda exception: Logger.exception(exception),
+            owner=self,
+            key=f"chart:{id(chart)}",
+        )
+        return None
 
     def vars(self) -> bool:
         crop = self.ids.crop.text if self.ids.crop.text else None
@@ -67,64 +81,147 @@ class Production(Screen):
                 return False
         return True
 
-    @mainthread  # type: ignore
     def set_data(self, data: list[ProductionModel], app: "AgroIndia") -> None:
         app.loading.dismiss()
         if not data:
             toast("No data found")
             return None
         self.data = data
-        self.draw_graphs()
+        self.draw_graphs(app)
         return None
 
-    def fetch_data(self, app: "AgroIndia") -> typing.Any:
+    def fetch_data(self, app: "AgroIndia") -> Task:
         crop = self.ids.crop.text if self.ids.crop.text else None
         season = self.ids.frequency.text if self.ids.frequency.text else None
         avg = self.ids.quantity.text if self.ids.quantity.text else None
-        data = app.api.production.get_produce(crop, season, avg)
-        return self.set_data(data, app)
+        return app.tasks.submit(
+            app.api.production.aget_produce(crop, season, avg),
+            lambda data: self.set_data(data, app),
+            owner=self,
+            key="produce",
+            args=(crop, season, avg),
+        )
 
     def run_thread(self, app: "AgroIndia") -> None:
         check = self.vars()
         if not check:
             return None
         app.loader("Loading data...")
-        Thread(target=self.fetch_data, args=(app,)).start()
+        self.fetch_data(app)
         return None
 
     def set_crop(self, crop: str) -> None:
         self.ids.crop.text = crop
         self.crops.dismiss()
 
+    def set_season(self, season: str) -> None:
+        self.ids.frequency.text = season
+        return None
+
     def prepare(self) -> None:
-        self.crops = MDDropdownMenu(
-            caller=self.ids.crop,
-            items=[
-                {"viewclass": "OneLineListItem", "text": crop, "on_release": lambda x=crop: self.set_crop(x)}
-                for crop in CROPS["crops"]
-            ],
-            width_mult=4,
-            position="auto",
-        )
-        self.seasons = MDDropdownMenu(
-            caller=self.ids.frequency,
-            items=[
-                {"viewclass": "OneLineListItem", "text": season, "on_release": lambda x=season: self.set_season(x)}
-                for season in ["Rabi", "Kharif"]
-            ],
-            width_mult=4,
-            position="auto",
-        )
+        if not hasattr(self, "crops"):
+            self.crops = TypeAhead(self.ids.crop, reference().crop_index, self.set_crop)
+        if not hasattr(self, "seasons"):
+            self.seasons = MenuField("seasons", self.ids.frequency, self.set_season).load("seasons", ("Rabi", "Kharif"))
+        return None
+
+
+class PriceRow(MDBoxLayout):
+    values: list[str] = ListProperty()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cells = [MDLabel(halign="center", font_style="Caption") for _ in PriceTable.COLUMNS]
+        for cell in self.cells:
+            self.add_widget(cell)
+
+    def on_values(self, _instance: "PriceRow", values: list[str]) -> None:
+        for cell, value in zip(self.cells, values):
+            cell.text = value
+        return None
+
+
+class PriceTable(MDBoxLayout):
+    """Virtualized price table, the recycle view only holds widgets for the visible rows of the current page."""
+
+    COLUMNS: tuple[str, ...] = (
+        "ID",
+        "State",
+        "District",
+        "Market",
+        "Crop",
+        "Variety",
+        "Arrival Date",
+        "Min Price",
+        "Max Price",
+        "Modal Price",
+    )
+    column_width: float = NumericProperty(dp(110))
+    page_text: str = StringProperty("0 / 0")
+    __events__ = ("on_export", "on_clear")
+
+    def __init__(self, page_size: int = 100, **kwargs: Any) -> None:
+        self.model = TableModel(page_size, keys={self.COLUMNS.index("Arrival Date"): self.arrival})
+        super().__init__(**kwargs)
+        for column, title in enumerate(self.COLUMNS):
+            self.ids.header.add_widget(
+                MDFlatButton(
+                    text=title,
+                    size_hint_x=1,
+                    on_release=lambda _x, c=column: self.sort(c),
+                )
+            )
+
+    @staticmethod
+    def arrival(value: str) -> str | None:
+        # dd/mm/yyyy does not sort as text, numpy is only imported once the column is sorted
+        from app.api.frame import parse_day
+
+        return parse_day(value)
+
+    def set_records(self, records: list[Prices]) -> None:
+        self.model.load(astuple(record) for record in records)
+        return self.refresh()
+
+    def sort(self, column: int) -> None:
+        self.model.sort(column)
+        for index, button in enumerate(reversed(self.ids.header.children)):
+            arrow = (" ▼" if self.model.reverse else " ▲") if index == column else ""
+            button.text = f"{self.COLUMNS[index]}{arrow}"
+        return self.refresh()
+
+    def next_page(self) -> None:
+        self.model.goto(self.model.page + 1)
+        return self.refresh()
+
+    def previous_page(self) -> None:
+        self.model.goto(self.model.page - 1)
+        return self.refresh()
+
+    def refresh(self) -> None:
+        self.ids.rows.data = [{"values": [str(value) for value in row]} for row in self.model.current()]
+        self.ids.rows.scroll_y = 1
+        self.page_text = f"{self.model.page + 1} / {self.model.pages} ({len(self.model)})"
+        return None
+
+    def on_export(self) -> None:
+        pass
+
+    def on_clear(self) -> None:
+        pass
 
 
 class Price(Screen):
-    markets: MDDropdownMenu
-    crops: MDDropdownMenu
-    state_menu: MDDropdownMenu
-    district_menu: MDDropdownMenu
+    markets: MenuField
+    crops: TypeAhead
+    state_menu: MenuField
+    district_menu: MenuField
     data: list[Prices]
-    states: dict[str, list[str]] = STATES
-    table: MDDataTable
+    table: PriceTable | None = None
+    frame: "PriceFrame | None" = None
+    query: tuple = ()
+    # whether ``frame`` holds every row matching ``query``, a server response may be one page of it
+    complete: bool = False
 
     def export_data(self) -> None:
         with open(
@@ -139,133 +236,50 @@ class Price(Screen):
         return None
 
     @property
-    def base_table(self) -> MDDataTable:
-        table = MDDataTable(
-            pos_hint={"center_x": 0.5, "center_y": 0.5},
-            background_color_header="#242629",
-            background_color_cell="#5a5c62",
-            background_color_selected_cell="#53648f",
-            size_hint=(0.9, 0.6),
-            use_pagination=True,
-            column_data=[
-                ("ID", dp(20)),
-                ("State", dp(20)),
-                ("District", dp(20)),
-                ("Market", dp(20)),
-                ("Crop", dp(20)),
-                ("Variety", dp(20)),
-                ("Arrival Date", dp(20)),
-                ("Min Price", dp(20)),
-                ("Max Price", dp(20)),
-                ("Modal Price", dp(20)),
-            ],
-            row_data=[],
-            elevation=5,
-        )
-        button_box = MDBoxLayout(
-            orientation="horizontal", spacing=dp(10), padding=dp(10), size_hint=(1, 1), pos_hint={"right": 1, "top": 0}
-        )
-        button_box.add_widget(
-            HoverRectangle(
-                text="Export",
-                on_release=lambda x: self.export_data(),  # type: ignore
-                pos_hint={"center_x": 0.5},  # type: ignore
-                icon="file-export",
-            )
-        )
-        button_box.add_widget(
-            HoverRectangle(
-                text="Clear",
-                on_release=lambda x: self.remove_widget(table),  # type: ignore
-                pos_hint={"center_x": 0.5},  # type: ignore
-                icon="cancel",
+    def base_table(self) -> PriceTable:
+        if self.table is None:
+            self.table = PriceTable()
+            self.table.bind(
+                on_export=lambda _table: self.export_data(),
+                on_clear=lambda table: self.remove_widget(table),
             )
-        )
-        table.add_widget(button_box)
-        return table
+        return self.table
 
     def prepare(self, app: "AgroIndia") -> None:
+        self.sync(app)
         self.ids.state.text = app.user.state
         self.ids.district.text = app.user.district
-        self.state_menu = MDDropdownMenu(
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": state,
-                    "on_release": lambda x=state: self.set_state(x),
-                }
-                for state in self.states
-            ],
-            width_mult=4,
-            caller=self.ids.state,
-            position="auto",
-        )
-        self.district_menu = MDDropdownMenu(
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": "Select a state first",
-                    "on_release": lambda x: None,
-                }
-            ],
-            width_mult=4,
-            caller=self.ids.district,
-            position="auto",
-        )
+        self.state_menu = MenuField("states", self.ids.state, self.set_state).load("states", reference().states)
+        self.district_menu = MenuField("districts", self.ids.district, self.set_district)
+        self.district_menu.load(("districts", app.user.state), reference().districts_of(app.user.state))
+        self.markets = MenuField("markets", self.ids.market, self.set_market)
+        self.set_markets(app.user.district)
         return None
 
     def set_state(self, state: str) -> None:
         self.ids.state.text = state
-        self.state_menu.dismiss()
-        self.district_menu = MDDropdownMenu(
-            caller=self.ids.district,
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": district,
-                    "on_release": lambda x=district: self.set_district(x),
-                }
-                for district in self.states[state]
-            ],
-            width_mult=4,
-            position="auto",
-        )
+        self.district_menu.load(("districts", state), reference().districts_of(state))
+        self.markets.hint("Pick your district first")
         return None
 
     def set_district(self, district: str) -> None:
         self.ids.district.text = district
-        self.district_menu.dismiss()
-        self.markets = MDDropdownMenu(
-            caller=self.ids.market,
-            items=[
-                {"viewclass": "OneLineListItem", "text": market, "on_release": lambda x=market: self.set_market(x)}
-                for market in MARKETS.get(self.ids.district.text, ["No markets found"])
-            ],
-            width_mult=4,
-            position="auto",
-        )
+        return self.set_markets(district)
+
+    def set_markets(self, district: str) -> None:
+        if markets := reference().markets_of(district):
+            self.markets.load(("markets", district), markets)
+        else:
+            self.markets.hint("No markets found")
         return None
 
     def set_market(self, market: str) -> None:
         self.ids.market.text = market
-        self.markets.dismiss()
         return None
 
     def get_crops(self) -> None:
-        self.markets = MDDropdownMenu(
-            items=[{"viewclass": "OneLineListItem", "text": "Pick your district first", "on_release": lambda x: None}],
-            width_mult=4,
-            position="auto",
-        )
-        self.crops = MDDropdownMenu(
-            caller=self.ids.crop,
-            items=[
-                {"viewclass": "OneLineListItem", "text": crop, "on_release": lambda x=crop: self.set_crop(x)}
-                for crop in CROPS["crops"]
-            ],
-            width_mult=4,
-            position="auto",
-        )
+        if not hasattr(self, "crops"):
+            self.crops = TypeAhead(self.ids.crop, reference().crop_index, self.set_crop)
         return None
 
     def set_crop(self, crop: str) -> None:
@@ -294,16 +308,17 @@ class Price(Screen):
 
     def check(self) -> bool:
         _id, state, district, market, crop, initial, final = self.get_vars()
-        if state and state not in self.states:
+        index = reference()
+        if state and not index.has_state(state):
             toast("Invalid state")
             return False
-        if district and district not in self.states[state]:
+        if district and not index.has_district(state, district):
             toast("Invalid district")
             return False
-        if market and market not in MARKETS.get(district, []):
+        if market and not index.has_market(district, market):
             toast("Invalid market")
             return False
-        if crop and crop not in CROPS["crops"]:
+        if crop and not index.has_crop(crop):
             toast("Invalid crop")
             return False
         if initial and not self.int_check(initial):
@@ -317,26 +332,78 @@ class Price(Screen):
             return False
         return True
 
-    def get_data(self, app: "AgroIndia") -> typing.Any:
-        _id, state, district, market, crop, initial, final = self.get_vars()
-        data = app.api.prices.get_price(_id, state, district, market, crop, initial, final)
+    def refines(self, query: tuple) -> bool:
+        """Whether ``query`` only adds criteria to the query the current frame was fetched with.
+
+        Only a complete frame can answer a narrower query without the server.
+        """
+        return (
+            self.frame is not None
+            and self.complete
+            and all(not old or old == new for old, new in zip(self.query, query))
+        )
+
+    def get_data(self, app: "AgroIndia") -> Task:
+        query = self.get_vars()
+        return app.tasks.submit(
+            app.api.prices.aget_price(*query),
+            lambda data: self.set_frame(query, data, app, complete=False),
+            owner=self,
+            key="prices",
+            args=("server", *query),
+        )
+
+    def get_local_data(self, app: "AgroIndia") -> Task:
+        query = self.get_vars()
+        snapshot = app.api.snapshot
+        assert snapshot is not None
+        return app.tasks.submit(
+            lambda: snapshot.query(*query),
+            lambda data: self.set_frame(query, data, app, complete=True),
+            owner=self,
+            key="prices",
+            args=("snapshot", *query),
+        )
+
+    def sync(self, app: "AgroIndia") -> Task | None:
+        """Refresh the offline copy of the prices table in the background once it is stale."""
+        if app.api.snapshot is None or not app.api.snapshot.stale():
+            return None
+        return app.tasks.submit(
+            app.api.prices.apull(app.api.snapshot),
+            error=lambda exception: Logger.exception(exception),
+            priority=Priority.BACKGROUND,
+        )
+
+    def set_frame(self, query: tuple, data: list[Prices], app: "AgroIndia", complete: bool) -> None:
+        from app.api import PriceFrame
+
+        self.frame = PriceFrame.from_records(data)
+        self.query = query
+        self.complete = complete
         return self.set_vars(data, app)
 
-    @mainthread  # type: ignore
     def set_vars(self, data: list[Prices], app: "AgroIndia") -> None:
         app.loading.dismiss()
         self.data = data
         table = self.base_table
-        for record in data:
-            table.add_row(tuple(map(str, record.__dict__.values())))
-        self.add_widget(table)
+        table.set_records(data)
+        if table.parent is None:
+            self.add_widget(table)
         return None
 
     def run_thread(self, app: "AgroIndia") -> None:
         if not self.check():
             return None
+        query = self.get_vars()
+        if self.frame is not None and self.refines(query):
+            app.tasks.cancel(self)
+            return self.set_vars(self.frame.filter(*query).records(), app)
         app.loader("Fetching data")
-        Thread(target=self.get_data, args=(app,)).start()
+        if app.api.snapshot is not None and app.api.snapshot.complete and len(app.api.snapshot):
+            self.get_local_data(app)
+            return None
+        self.get_data(app)
         return None
 
 
@@ -363,16 +430,19 @@ class Encyclopedia(Screen):
 
     def search(self, app: "AgroIndia") -> None:
         app.loader("Searching...")
-        thread = Thread(target=self.get_info, args=(app,))
-        thread.start()
+        self.get_info(app)
         return None
 
-    def get_info(self, app: "AgroIndia") -> Any:
+    def get_info(self, app: "AgroIndia") -> Task:
         query = self.ids.search.text
-        data = app.api.encyclopedia.get_encyclopedia(query)
-        return self.set_vars(data, app)
+        return app.tasks.submit(
+            app.api.encyclopedia.aget_encyclopedia(query),
+            lambda data: self.set_vars(data, app),
+            owner=self,
+            key="search",
+            args=query,
+        )
 
-    @mainthread  # type: ignore
     def set_vars(self, data: Plant, app: "AgroIndia") -> None:
         if not data:
             return app.deload(self.display_error, app)
@@ -488,47 +558,56 @@ class Lens(Screen):
         if not self.images:
             toast(app.translate("No image selected"))
             return None
-        app.loader("Starting analysis")
-        Thread(target=self._diag, args=(app,)).start()
+        app.loader("Uploading image", progress=True)
+        app.tasks.submit(
+            app.api.lens.adiagnose(memoryview(self.images), app.progress),
+            lambda data: self.set_diag(data, app),
+            owner=self,
+            key="diagnose",
+            args=self.images,
+        )
         return None
 
     def info(self, app: "AgroIndia") -> None:
         if not self.images:
             toast(app.translate("No image selected"))
             return None
-        app.loader("Starting analysis")
-        Thread(target=self._info, args=(app,)).start()
-        return None
-
-    def _info(self, app: "AgroIndia") -> None:
-        res = app.api.lens.identify(self.images)
-        self.set_info(res, app)
-        return None
-
-    def _diag(self, app: "AgroIndia") -> None:
-        res = app.api.lens.diagnose(self.images)
-        self.set_diag(res, app)
+        app.loader("Uploading image", progress=True)
+        app.tasks.submit(
+            app.api.lens.aidentify(memoryview(self.images), app.progress),
+            lambda data: self.set_info(data, app),
+            owner=self,
+            key="identify",
+            args=self.images,
+        )
         return None
 
-    @mainthread  # type: ignore
     def set_diag(self, data: dict, app: "AgroIndia") -> None:
         self.ddata = data
         app.deload(self.set_diag_card, app)
         return None
 
-    @mainthread  # type: ignore
     def set_info(self, data: dict, app: "AgroIndia") -> None:
         self.idata = data
         app.deload(self.set_info_card, app)
         return None
 
     def stream(self) -> None:
+        # the preview shares the camera texture, which is updated in place, so it only needs rebinding when the
+        # camera replaces it
         camera = self.ids.capture
         camera.play = True
-        Clock.schedule_interval(self.update, 1 / 30)
+        camera.bind(texture=self.update)
+        self.update()
         return None
 
-    def update(self, *_args: str) -> None:
+    def pause(self) -> None:
+        camera = self.ids.capture
+        camera.unbind(texture=self.update)
+        camera.play = False
+        return None
+
+    def update(self, *_args: Any) -> None:
         frame = self.ids.image
         camera = self.ids.capture
         if camera.texture:
@@ -536,31 +615,59 @@ class Lens(Screen):
         return None
 
     def capture(self, app: "AgroIndia") -> None:
-        camera = self.ids.capture
-        path = f"app/.data/{datetime.now().strftime('%Y%m%d%H%M%S')}.png"
-        camera.export_to_png(path)
-        self.ids.fit_image.source = path
-        with open(path, "rb") as f:
-            self.images = f.read()
+        from app.api.lens import encode, from_texture, resize
+
+        texture = self.ids.capture.texture
+        if texture is None:
+            toast(app.translate("No image selected"))
+            return None
+        width, height = texture.size
+        pixels = texture.pixels
+        still = Texture.create(size=texture.size, colorfmt="rgba")
+        still.blit_buffer(pixels, colorfmt="rgba", bufferfmt="ubyte")
+        self.ids.fit_image.texture = still
+        app.tasks.submit(
+            lambda: encode(resize(from_texture(pixels, width, height))),
+            lambda data: self.set_image(data, app),
+            error=lambda exception: Logger.exception(exception),
+            owner=self,
+            key="capture",
+        )
+        return None
+
+    def set_image(self, data: bytes, app: "AgroIndia") -> None:
+        self.images = data
         toast(app.translate("Image captured"))
         return None
 
-    def open_manager(self) -> None:
+    def open_manager(self, app: "AgroIndia") -> None:
         self.files = MDFileManager(
             exit_manager=self.exit_manager,
-            select_path=self.select_path,
+            select_path=lambda path: self.select_path(path, app),
             ext=[".jpg", ".jpeg", ".png"],
             show_hidden_files=True,
         )
         self.files.show(os.path.expanduser("~"))
         self.show = True
 
-    def select_path(self, path: str) -> None:
-        with open(path, "rb") as f:
-            self.images = f.read()
+    def select_path(self, path: str, app: "AgroIndia") -> None:
+        from app.api.lens import preprocess
+
+        self.images = None
         self.ids.fit_image.source = path
         self.exit_manager()
         toast(path)
+        app.tasks.submit(
+            lambda: preprocess(pathlib.Path(path)),
+            self.set_photo,
+            error=lambda exception: Logger.exception(exception),
+            owner=self,
+            key="capture",
+        )
+        return None
+
+    def set_photo(self, data: bytes) -> None:
+        self.images = data
         return None
 
     def exit_manager(self, *_args: Any) -> None:
@@ -579,14 +686,9 @@ class Weather(Screen):
         self.manager.current = "home"
 
     def update_widgets(self, app: "AgroIndia") -> None:
-        swiper = self.ids.swiper
-        for i in range(len(swiper.get_items())):
-            swiper.remove_widget(swiper.get_items()[0])
         days = self.weather["days"][0]
-        hours = days["hours"]
-        swiper.add_widget(Report(days, app))
-        for hour in hours:
-            swiper.add_widget(Report(hour, app))
+        self.ids.swiper.viewclass = lambda: Report(None, app)
+        self.ids.swiper.data = [days, *days["hours"]]
         return None
 
     def run_thread(self, app: "AgroIndia", day: str = None, reset: bool = False) -> None:
@@ -594,21 +696,23 @@ class Weather(Screen):
         if self.weather and not reset:
             return None
         app.loader("Loading weather...")
-        thread = Thread(target=self.get_weather, args=(app, day))
-        thread.start()
+        self.get_weather(app, day)
         return None
 
-    @mainthread  # type: ignore
     def set_vars(self, data: dict, app: "AgroIndia") -> None:
         self.weather = data
         app.deload(self.update_widgets, app)
         return None
 
-    def get_weather(self, app: "AgroIndia", day: str | None = None) -> Any:
-        times = app.api.weather.daily(
-            app.user.phone, self.location or f"{app.user.state}, {app.user.district}", day or None
+    def get_weather(self, app: "AgroIndia", day: str | None = None) -> Task:
+        location = self.location or f"{app.user.state}, {app.user.district}"
+        return app.tasks.submit(
+            app.api.weather.adaily(app.user.phone, location, day or None),
+            lambda data: self.set_vars(data, app),
+            owner=self,
+            key="weather",
+            args=(location, day),
         )
-        return self.set_vars(times, app)
 
     def set_location(self, app: "AgroIndia") -> None:
         self.location = self.dialog.content_cls.ids.location.text
@@ -1,15 +1,13 @@
 import textwrap
-from threading import Thread
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from kivy.clock import mainthread
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.screenmanager import Screen, WipeTransition
-from kivymd.uix.menu import MDDropdownMenu
 
 from app.api import User
-from app.utils import STATES, BlockLabel
+from app.gui.helpers import MenuField
+from app.utils import BlockLabel, Task, reference
 
 if TYPE_CHECKING:
     from app import AgroIndia
@@ -23,17 +21,16 @@ class LoginWindow(Screen):
 
     def run_thread(self, app: "AgroIndia") -> None:
         app.loader("Logging in...")
-        thread = Thread(target=self.check_creds, args=(app,))
-        thread.start()
+        self.check_creds(app)
         return None
 
-    def check_creds(self, app: "AgroIndia") -> Any:
+    def check_creds(self, app: "AgroIndia") -> Task:
         phone = self.ids.phone.text
         password = self.ids.password.text
-        response, data = app.api.users.login(phone, password)
-        return self.set_vars(response, data, app)
+        return app.tasks.submit(
+            app.api.users.alogin(phone, password), lambda result: self.set_vars(result[0], result[1], app), owner=self
+        )
 
-    @mainthread  # type: ignore
     def set_vars(self, response: bool, data: dict | str, app: "AgroIndia") -> None:
         self.response = response
         self.data = data
@@ -61,9 +58,8 @@ class LoginWindow(Screen):
 class SignupWindow(Screen):
 
     popup: Popup
-    state_menu: MDDropdownMenu
-    district_menu: MDDropdownMenu
-    states: dict[str, list[str]] = STATES
+    state_menu: MenuField
+    district_menu: MenuField
 
     def signup(self, app: "AgroIndia") -> None:
         username = self.ids.username.text
@@ -71,11 +67,11 @@ class SignupWindow(Screen):
         phone = self.ids.phone.text
         state = self.ids.state.text
         district = self.ids.district.text
-        if state not in self.states:
+        if not reference().has_state(state):
             return self.display_invalid_signup(
                 app.translate("Invalid State"), app.translate("Invalid state selected"), app
             )
-        if district not in self.states[state]:
+        if not reference().has_district(state, district):
             return self.display_invalid_signup(
                 app.translate("Invalid District"), app.translate("Invalid district selected"), app
             )
@@ -83,7 +79,15 @@ class SignupWindow(Screen):
             return self.display_invalid_signup(
                 app.translate("Invalid Signup"), app.translate("Password must be atleast 8 characters long"), app
             )
-        response, data = app.api.users.register(phone, username, password, state, district)
+        app.loader("Registering...")
+        app.tasks.submit(
+            app.api.users.aregister(phone, username, password, state, district),
+            lambda result: app.deload(self.registered, *result, app),
+            owner=self,
+        )
+        return None
+
+    def registered(self, response: bool, data: User | str, app: "AgroIndia") -> None:
         if not response and isinstance(data, str):
             text1, text2 = app.translate("Invalid Signup"), app.translate(f"{textwrap.fill(data, 50)}")
             return self.display_invalid_signup(text1, text2, app)
@@ -91,48 +95,17 @@ class SignupWindow(Screen):
         return None
 
     def prepare(self) -> None:
-        self.state_menu = MDDropdownMenu(
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": state,
-                    "on_release": lambda x=state: self.set_state(x),
-                }
-                for state in self.states
-            ],
-            width_mult=4,
-            caller=self.ids.state,
-            position="auto",
-        )
-        self.district_menu = MDDropdownMenu(
-            items=[{"viewclass": "OneLineListItem", "text": "Select a state first"}],
-            width_mult=4,
-            caller=self.ids.district,
-            position="auto",
-        )
+        self.state_menu = MenuField("states", self.ids.state, self.set_state).load("states", reference().states)
+        self.district_menu = MenuField("districts", self.ids.district, self.set_district).hint("Select a state first")
         return None
 
     def set_state(self, state: str) -> None:
         self.ids.state.text = state
-        self.district_menu = MDDropdownMenu(
-            items=[
-                {
-                    "viewclass": "OneLineListItem",
-                    "text": district,
-                    "on_release": lambda x=district: self.set_district(x),
-                }
-                for district in self.states[self.ids.state.text]
-            ],
-            width_mult=4,
-            caller=self.ids.district,
-            position="auto",
-        )
-        self.state_menu.dismiss()
+        self.district_menu.load(("districts", state), reference().districts_of(state))
         return None
 
     def set_district(self, district: str) -> None:
         self.ids.district.text = district
-        self.district_menu.dismiss()
         return None
 
     def display_invalid_signup(self, title: str, message: str, app: "AgroIndia") -> None:
@@ -1,36 +1,85 @@
+import importlib
 import os
+from typing import Any, Callable
 
+from kivy.clock import Clock
 from kivy.lang import Builder
-from kivy.uix.screenmanager import ScreenManager
+from kivy.uix.screenmanager import Screen, ScreenManager
 
-from .helpers import Settings
-from .home import Encyclopedia, Home, Lens, Price, Production, Weather
-from .login import LoginWindow, SignupWindow
+
+class LazyScreenManager(ScreenManager):
+    """Screen manager that builds registered screens the first time they are looked up."""
+
+    def __init__(self, builder: Callable[[str], Screen | None], **kwargs: Any) -> None:
+        self.builder = builder
+        super().__init__(**kwargs)
+
+    def get_screen(self, name: str) -> Screen:
+        if not self.has_screen(name):
+            self.builder(name)
+        return super().get_screen(name)
 
 
 class Render:
 
     templates: str = "app/templates"
+    SCREENS: dict[str, tuple[str, str]] = {
+        "login": ("app.gui.login:LoginWindow", "register.kv"),
+        "signup": ("app.gui.login:SignupWindow", "register.kv"),
+        "home": ("app.gui.home:Home", "home.kv"),
+        "settings": ("app.gui.helpers:Settings", "settings.kv"),
+        "weather": ("app.gui.home:Weather", "weather.kv"),
+        "lens": ("app.gui.home:Lens", "lens.kv"),
+        "info": ("app.gui.home:Encyclopedia", "search.kv"),
+        "prices": ("app.gui.home:Price", "prices.kv"),
+        "production": ("app.gui.home:Production", "production.kv"),
+    }
+    EAGER: tuple[str, ...] = ("login", "home")
+    PREWARM: tuple[str, ...] = ("signup", "settings", "prices", "info", "production", "weather")
 
-    def __init__(self) -> None:
-        self.screens = ScreenManager()
+    def __init__(self, prewarm: bool = True) -> None:
+        self.screens = LazyScreenManager(self.build)
+        self.prewarm = prewarm
+        self.loaded: set[str] = set()
         self.setup()
 
     def render(self) -> ScreenManager:
-        self.screens.add_widget(LoginWindow(name="login"))
-        self.screens.add_widget(SignupWindow(name="signup"))
-        self.screens.add_widget(Settings(name="settings"))
-        self.screens.add_widget(Home(name="home"))
-        self.screens.add_widget(Weather(name="weather"))
-        self.screens.add_widget(Lens(name="lens"))
-        self.screens.add_widget(Encyclopedia(name="info"))
-        self.screens.add_widget(Price(name="prices"))
-        self.screens.add_widget(Production(name="production"))
+        for name in self.EAGER:
+            self.build(name)
+        if self.prewarm:
+            Clock.schedule_once(lambda _dt: self.warm(list(self.PREWARM)), 1)
         return self.screens
 
+    def build(self, name: str) -> Screen | None:
+        if self.screens.has_screen(name) or name not in self.SCREENS:
+            return None
+        path, template = self.SCREENS[name]
+        self.load(template)
+        module, cls = path.split(":")
+        screen: Screen = getattr(importlib.import_module(module), cls)(name=name)
+        self.screens.add_widget(screen)
+        print(f"✅ Built screen {name}")
+        return screen
+
+    def warm(self, pending: list[str]) -> None:
+        """Build one pending screen per frame so pre-warming never blocks a whole frame."""
+        while pending and self.screens.has_screen(pending[0]):
+            pending.pop(0)
+        if not pending:
+            return None
+        self.build(pending.pop(0))
+        Clock.schedule_once(lambda _dt: self.warm(pending), 0.2)
+        return None
+
+    def load(self, template: str) -> None:
+        if template in self.loaded:
+            return None
+        Builder.load_file(os.path.join(self.templates, template))
+        self.loaded.add(template)
+        print(f"✅ Loaded {os.path.join(self.templates, template)}")
+        return None
+
     def setup(self) -> None:
-        for file in os.listdir(self.templates):
-            if file.endswith(".kv"):
-                Builder.load_file(os.path.join(self.templates, file))
-                print(f"✅ Loaded {os.path.join(self.templates, file)}")
+        for name in self.EAGER:
+            self.load(self.SCREENS[name][1])
         return None
@@ -0,0 +1,107 @@
+"""Build-time translation bundles.
+
+Run ``python __main__.py --bundle`` to collect every literal passed to ``app.translate(...)`` in ``app/gui``,
+``app/utils/widgets.py`` and the ``.kv`` templates and write one lookup table per language to
+``app/assets/translations/<code>.json``. Translations already in the shipped bundle or in ``app/.data/translation.db``
+are reused and the rest are translated in batches; whatever cannot be translated is left to the runtime translator.
+"""
+
+import ast
+import json
+import os
+import pathlib
+import re
+from typing import Iterable, Iterator
+
+__all__: tuple[str, ...] = (
+    "build",
+    "extract",
+    "main",
+)
+
+ROOT: pathlib.Path = pathlib.Path(__file__).parent
+SOURCES: tuple[pathlib.Path, ...] = (ROOT / "gui", ROOT / "utils" / "widgets.py", ROOT / "templates")
+# callables whose leading positional arguments end up in app.translate
+WRAPPERS: dict[str, int] = {"translate": 1, "display_invalid_signup": 2}
+KV = re.compile(r"""app\.translate\(\s*("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')\s*\)""")
+
+
+def files(sources: Iterable[pathlib.Path]) -> Iterator[pathlib.Path]:
+    for source in sources:
+        if source.is_dir():
+            yield from sorted(source.rglob("*.py"))
+            yield from sorted(source.rglob("*.kv"))
+        elif source.exists():
+            yield source
+
+
+def literal(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr) and all(isinstance(value, ast.Constant) for value in node.values):
+        return "".join(str(value.value) for value in node.values if isinstance(value, ast.Constant))
+    return None
+
+
+def literals(node: ast.Call) -> Iterator[str]:
+    if isinstance(node.func, ast.Attribute):
+        name = node.func.attr
+    elif isinstance(node.func, ast.Name):
+        name = node.func.id
+    else:
+        return
+    for arg in node.args[: WRAPPERS.get(name, 0)]:
+        text = literal(arg)
+        if text:
+            yield text
+
+
+def extract(sources: Iterable[pathlib.Path] = SOURCES) -> list[str]:
+    """Every constant string the UI passes to ``app.translate``, f-strings with placeholders are skipped."""
+    strings: set[str] = set()
+    for path in files(sources):
+        source = path.read_text(encoding="utf-8")
+        if path.suffix == ".kv":
+            strings.update(ast.literal_eval(match[1]) for match in KV.finditer(source))
+        else:
+            tree = ast.parse(source, filename=str(path))
+            strings.update(text for node in ast.walk(tree) if isinstance(node, ast.Call) for text in literals(node))
+    return sorted(text for text in strings if text.strip())
+
+
+def build(strings: list[str], languages: Iterable[str], output: pathlib.Path | None = None) -> dict[str, int]:
+    """Write ``<lang>.json`` for every language, returns how many of ``strings`` each bundle covers."""
+    from app.utils.translation import BUNDLES, TranslationStore, read_bundle, translate_batch
+
+    output = output or BUNDLES
+    output.mkdir(parents=True, exist_ok=True)
+    store = TranslationStore(ROOT / ".data" / "translation.db", legacy=ROOT / ".data" / "translation.json")
+    wanted = set(strings)
+    counts: dict[str, int] = {}
+    for lang in languages:
+        if lang == "en":
+            continue
+        path = output / f"{lang}.json"
+        known = {**store.items(lang), **read_bundle(path)}
+        bundle = {text: value for text, value in known.items() if text in wanted and value}
+        missing = [text for text in strings if text not in bundle]
+        if missing:
+            try:
+                bundle.update(translate_batch(lang, missing))
+            except Exception as exception:
+                print(
+                    f"⚠️ Left {len(missing)} strings to the runtime translator for {lang}: {type(exception).__name__}"
+                )
+        path.write_text(json.dumps(dict(sorted(bundle.items())), indent=4, ensure_ascii=False) + "\n", encoding="utf-8")
+        counts[lang] = len(bundle)
+        print(f"✅ Bundled {len(bundle)}/{len(strings)} strings for {lang}")
+    store.close()
+    return counts
+
+
+def main() -> None:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    from app.utils import LANGUAGES
+
+    build(extract(), LANGUAGES.values())
+    return None
@@ -0,0 +1,204 @@
+"""Startup timeline for the AgroIndia entry point.
+
+Run ``python __main__.py --profile`` to record import costs and per-phase timings up to the first rendered frame, or
+add ``--headless`` to stop after the root widget is built without entering the main loop (useful for benchmarks).
+Headless runs skip the background music, but kivy still creates its GL window, so they need a display (or a virtual
+one such as Xvfb). The report is written to ``app/.data/startup.json``.
+
+This module only depends on the standard library so it can be imported before kivy.
+"""
+
+import contextlib
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import os
+import pathlib
+import platform
+import sys
+import threading
+import time
+import types
+from typing import Any, Callable, Iterator, Sequence
+
+__all__: tuple[str, ...] = (
+    "ImportTimer",
+    "Timeline",
+    "main",
+)
+
+PATH: pathlib.Path = pathlib.Path(__file__).parent / ".data"
+
+
+class _TimedLoader:
+    def __init__(self, loader: Any, name: str, timer: "ImportTimer") -> None:
+        self.loader = loader
+        self.name = name
+        self.timer = timer
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.loader, item)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType | None:
+        module: types.ModuleType | None = self.loader.create_module(spec)
+        return module
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        stack = self.timer.stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self.timer.records[self.name] = (cumulative - children, cumulative)
+        return None
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook measuring self and cumulative execution time of every module imported while installed."""
+
+    def __init__(self) -> None:
+        self.records: dict[str, tuple[float, float]] = {}
+        self._local = threading.local()
+
+    @property
+    def stack(self) -> list[float]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        stack: list[float] = self._local.stack
+        return stack
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str | bytes] | None, target: types.ModuleType | None = None
+    ) -> importlib.machinery.ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec: importlib.machinery.ModuleSpec | None = finder.find_spec(fullname, path, target)  # type: ignore[arg-type]
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, fullname, self)  # type: ignore
+            return spec
+        return None
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+        return None
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        return None
+
+    def top(self, count: int = 30) -> list[dict[str, Any]]:
+        ranked = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)[:count]
+        return [{"module": name, "self": round(own, 4), "cumulative": round(total, 4)} for name, (own, total) in ranked]
+
+
+class Timeline:
+    """Named phases relative to the moment the timeline was created."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.phases: list[dict[str, Any]] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {
+                    "name": name,
+                    "start": round(start - self.origin, 4),
+                    "duration": round(time.perf_counter() - start, 4),
+                }
+            )
+
+    def mark(self, name: str) -> None:
+        now = round(time.perf_counter() - self.origin, 4)
+        self.phases.append({"name": name, "start": now, "duration": 0.0})
+        return None
+
+    def wrap(self, owner: Any, attribute: str) -> None:
+        """Time every call of ``owner.attribute`` as its own phase."""
+        function: Callable[..., Any] = getattr(owner, attribute)
+        label = f"{getattr(owner, '__name__', type(owner).__name__)}.{attribute}"
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(label):
+                return function(*args, **kwargs)
+
+        setattr(owner, attribute, timed)
+        return None
+
+    def report(self, imports: ImportTimer) -> dict[str, Any]:
+        return {
+            "created_at": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "total": round(time.perf_counter() - self.origin, 4),
+            "phases": self.phases,
+            "imports": imports.top(),
+        }
+
+    def write(self, imports: ImportTimer, path: pathlib.Path = PATH / "startup.json") -> pathlib.Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = self.report(imports)
+        temp = path.with_suffix(".tmp")
+        temp.write_text(json.dumps(report, indent=4))
+        os.replace(temp, path)
+        print(f"⏱️ Startup took {report['total']:.3f}s, report written to {path}")
+        for phase in sorted(self.phases, key=lambda p: float(p["duration"]), reverse=True)[:10]:
+            print(f"   {phase['duration']:>8.3f}s  {phase['name']}")
+        return path
+
+
+def main(headless: bool = False) -> None:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    timeline = Timeline()
+    imports = ImportTimer()
+    imports.install()
+    with timeline.phase("import app"):
+        from app.api import Base
+        from app.app import AgroIndia
+        from app.gui import Render
+    for owner, attribute in [
+        (AgroIndia, "setup"),
+        (AgroIndia, "build"),
+        (AgroIndia, "randomize"),
+        (AgroIndia, "generate_theme"),
+        (Render, "setup"),
+        (Render, "render"),
+        (Render, "build"),
+        (Base, "run"),
+    ]:
+        timeline.wrap(owner, attribute)
+    with timeline.phase("AgroIndia()"):
+        app = AgroIndia()
+    if headless:
+        # benchmarks run on machines without audio, the music is not part of what we measure
+        app.randomize = lambda: None  # type: ignore[assignment]
+        app.build()
+        imports.uninstall()
+        timeline.write(imports)
+        return None
+
+    def first_frame(_dt: float) -> None:
+        timeline.mark("first frame")
+        imports.uninstall()
+        timeline.write(imports)
+        return None
+
+    from kivy.clock import Clock
+
+    Clock.schedule_once(first_frame, 0)
+    app.run()
+    return None
@@ -1,4 +1,13 @@
-from .data import COLORS, CROPS, LANGUAGES, MARKETS, PALETTE, STATES
+from typing import Any
+
+from . import data
+from .charts import Chart, cached_texture, render_production, upload
+from .data import COLORS, LANGUAGES, PALETTE
+from .reference import Reference, reference
+from .search import Autocomplete
+from .table import TableModel
+from .tasks import Priority, Scheduler, Task
+from .translation import TranslationStore, Translator
 from .widgets import (
     BlockLabel,
     HoverBehavior,
@@ -6,6 +15,13 @@ from .widgets import (
     HoverIconButton,
     HoverRectangle,
     NewShadowWidget,
-    Plot,
+    RecycleSwiper,
     Report,
 )
+
+
+def __getattr__(name: str) -> Any:
+    # the bulky reference data is only read from its asset when first used
+    if name in ("CROPS", "MARKETS", "STATES"):
+        return getattr(data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
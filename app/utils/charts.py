@@ -0,0 +1,135 @@
+"""Plotting facade.
+
+matplotlib is the most expensive import in the app and only the Production screen needs it, so it is imported the
+first time a chart is rendered instead of at startup.
+
+Charts are drawn with the object oriented ``Figure`` API onto an Agg canvas, which needs no pyplot global state and is
+safe to run on a worker thread. Only the final RGBA buffer crosses over to the main thread, where it is uploaded into a
+texture and shown by a plain image widget. Textures are cached by ``(crop, unit, values hash)``.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from kivy.graphics.texture import Texture
+from kivy.uix.image import Image
+from kivymd.uix.swiper import MDSwiperItem
+
+if TYPE_CHECKING:
+    from app.api import Production
+
+__all__: tuple[str, ...] = (
+    "Chart",
+    "Raster",
+    "cached_texture",
+    "chart_key",
+    "render_production",
+    "upload",
+)
+
+ChartKey = tuple[str, str, int]
+SETUP: threading.Lock = threading.Lock()
+
+
+class Raster(NamedTuple):
+    key: ChartKey
+    width: int
+    height: int
+    pixels: bytes
+
+
+class Chart(MDSwiperItem):
+    """Swiper item displaying a pre-rendered chart texture.
+
+    ``loader(chart, value)`` is called whenever the item is rebound and is expected to call :meth:`show` once the
+    texture for ``value`` is available.
+    """
+
+    def __init__(self, loader: Callable[["Chart", Any], Any], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.loader = loader
+        self.value: Any = None
+        self.pos_hint = {"center_x": 0.5, "center_y": 0.5}
+        self.size_hint = (0.9, 0.9)
+        self.image = Image(allow_stretch=True, keep_ratio=True)
+        self.add_widget(self.image)
+
+    def bind_data(self, value: Any) -> None:
+        self.value = value
+        self.image.texture = None
+        self.loader(self, value)
+        return None
+
+    def show(self, value: Any, texture: Texture) -> None:
+        if value is self.value:
+            self.image.texture = texture
+        return None
+
+
+TEXTURES: OrderedDict[ChartKey, Texture] = OrderedDict()
+MAX_TEXTURES: int = 32
+
+
+@cache
+def _matplotlib() -> Any:
+    import matplotlib
+    import matplotlib.style
+
+    matplotlib.style.use("seaborn-v0_8" if "seaborn-v0_8" in matplotlib.style.available else "seaborn")
+    print("📊 Loaded matplotlib")
+    return matplotlib
+
+
+def matplotlib() -> Any:
+    # charts render on several worker threads and the style is global, it must be applied exactly once
+    with SETUP:
+        return _matplotlib()
+
+
+def chart_key(crop: "Production") -> ChartKey:
+    return crop.CROP, crop.UNIT, hash(tuple(crop.VALUES))
+
+
+def render_production(crop: "Production", size: tuple[float, float] = (6.4, 4.8), dpi: int = 100) -> Raster:
+    """Rasterize the production chart of ``crop``, safe to call off the main thread."""
+    matplotlib()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    years = {value.YEAR: value.PRODUCE for value in crop.VALUES if value.PRODUCE}
+    figure = Figure(figsize=size, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.bar(list(years.keys()), list(years.values()), color="yellow", edgecolor="black")
+    axes.plot(list(years.keys()), list(years.values()), color="red", marker="o")
+    axes.set_title(f"{crop.CROP}")
+    axes.set_xlabel("Years")
+    axes.set_ylabel(f"Production in {crop.UNIT}")
+    axes.legend(["Production", "Trend"])
+    canvas.draw()  # type: ignore[no-untyped-call]
+    width, height = canvas.get_width_height()
+    return Raster(chart_key(crop), width, height, bytes(canvas.buffer_rgba()))  # type: ignore[no-untyped-call]
+
+
+def upload(raster: Raster) -> Texture:
+    """Upload ``raster`` into a texture, must run on the main thread."""
+    if raster.key in TEXTURES:
+        TEXTURES.move_to_end(raster.key)
+        return TEXTURES[raster.key]
+    tex = Texture.create(size=(raster.width, raster.height), colorfmt="rgba")
+    tex.blit_buffer(raster.pixels, colorfmt="rgba", bufferfmt="ubyte")
+    tex.flip_vertical()
+    TEXTURES[raster.key] = tex
+    while len(TEXTURES) > MAX_TEXTURES:
+        TEXTURES.popitem(last=False)
+    return tex
+
+
+def cached_texture(crop: "Production") -> Texture | None:
+    key = chart_key(crop)
+    if key in TEXTURES:
+        TEXTURES.move_to_end(key)
+        return TEXTURES[key]
+    return None
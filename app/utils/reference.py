@@ -0,0 +1,84 @@
+from functools import cache, cached_property
+
+from . import data
+from .search import Autocomplete
+
+__all__: tuple[str, ...] = (
+    "Reference",
+    "reference",
+)
+
+
+class Reference:
+    """States, districts, markets and crops compiled into lookup structures.
+
+    Membership checks are set lookups, reverse lookups (market to district, district to state) are dict lookups and
+    every list has a lazily built :class:`Autocomplete` index for type-ahead.
+    """
+
+    def __init__(
+        self,
+        states: dict[str, list[str]],
+        markets: dict[str, list[str]],
+        crops: list[str],
+    ) -> None:
+        self.states: tuple[str, ...] = tuple(states)
+        self.districts: dict[str, tuple[str, ...]] = {state: tuple(districts) for state, districts in states.items()}
+        self.markets: dict[str, tuple[str, ...]] = {district: tuple(names) for district, names in markets.items()}
+        self.crops: tuple[str, ...] = tuple(sorted(set(crops), key=str.casefold))
+        self._districts = {state: frozenset(districts) for state, districts in states.items()}
+        self._markets = {district: frozenset(names) for district, names in markets.items()}
+        self._crops = frozenset(self.crops)
+        self.state_of: dict[str, str] = {}
+        for state, districts in states.items():
+            for district in districts:
+                self.state_of.setdefault(district, state)
+        self.district_of: dict[str, str] = {}
+        for district, names in markets.items():
+            for market in names:
+                self.district_of.setdefault(market, district)
+
+    @cached_property
+    def state_index(self) -> Autocomplete:
+        return Autocomplete(self.states)
+
+    @cached_property
+    def district_index(self) -> Autocomplete:
+        return Autocomplete(district for districts in self.districts.values() for district in districts)
+
+    @cached_property
+    def market_index(self) -> Autocomplete:
+        return Autocomplete(market for markets in self.markets.values() for market in markets)
+
+    @cached_property
+    def crop_index(self) -> Autocomplete:
+        return Autocomplete(self.crops)
+
+    def has_state(self, state: str) -> bool:
+        return state in self._districts
+
+    def has_district(self, state: str, district: str) -> bool:
+        return district in self._districts.get(state, ())
+
+    def has_market(self, district: str, market: str) -> bool:
+        return market in self._markets.get(district, ())
+
+    def has_crop(self, crop: str) -> bool:
+        return crop in self._crops
+
+    def districts_of(self, state: str) -> tuple[str, ...]:
+        return self.districts.get(state, ())
+
+    def markets_of(self, district: str) -> tuple[str, ...]:
+        return self.markets.get(district, ())
+
+
+@cache
+def compiled(version: int) -> Reference:
+    payload = data.load()
+    return Reference(payload["states"], payload["markets"], payload["crops"])
+
+
+def reference() -> Reference:
+    """Compiled reference data, rebuilt once after the backend installs a newer version."""
+    return compiled(data.VERSION)
@@ -0,0 +1,122 @@
+import bisect
+import re
+from typing import Iterable
+
+__all__: tuple[str, ...] = ("Autocomplete",)
+
+TOKEN = re.compile(r"[^\W_]+")
+
+
+def distance(a: str, b: str, limit: int, prefix: bool = False) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance, anything above ``limit`` is reported as ``limit + 1``.
+
+    With ``prefix`` it is the distance from ``a`` to the closest start of ``b``, i.e. ``a`` may still be incomplete.
+    """
+    if len(a) - len(b) > limit or (not prefix and len(b) - len(a) > limit):
+        return limit + 1
+    before: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, y in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y))
+            if i > 1 and j > 1 and x == b[j - 2] and a[i - 2] == y and x != y:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(min(previous) if prefix else previous[-1], limit + 1)
+
+
+class Autocomplete:
+    """Ranked, typo tolerant type-ahead over a fixed list of names.
+
+    Prefix matches are found by binary search over the sorted word tokens of every name. Misspelt queries fall back to
+    the edit distance between every query word and the words of each name, or their start while the word is still
+    being typed. A transposition counts as one typo, words of 4 or 5 letters allow one and longer words ``typos``.
+    Results are ranked exact match, then names starting with the query, then names with a word starting with the
+    query, then by fewest typos; ties prefer shorter names. Names beyond the typo budget are never returned.
+    """
+
+    def __init__(self, names: Iterable[str], typos: int = 2) -> None:
+        self.names: tuple[str, ...] = tuple(dict.fromkeys(names))
+        self.typos = typos
+        self.folded = [self.normalize(name) for name in self.names]
+        tokens = sorted(
+            (token, index, position)
+            for index, name in enumerate(self.folded)
+            for position, token in enumerate(name.split())
+        )
+        self.tokens = [token for token, _index, _position in tokens]
+        self.owners = [(index, position) for _token, index, position in tokens]
+        self.words: dict[str, set[int]] = {}
+        for token, (index, _position) in zip(self.tokens, self.owners):
+            self.words.setdefault(token, set()).add(index)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(TOKEN.findall(text.casefold()))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def prefix(self, query: str) -> dict[int, float]:
+        scores: dict[int, float] = {}
+        start = bisect.bisect_left(self.tokens, query)
+        end = bisect.bisect_right(self.tokens, query + "\U0010ffff", lo=start)
+        for index, position in self.owners[start:end]:
+            scores[index] = max(scores.get(index, 0.0), 3.0 if position == 0 else 2.0)
+        for index in list(scores):
+            if self.folded[index] == query:
+                scores[index] = 4.0
+            elif scores[index] < 3.0 and self.folded[index].startswith(query):
+                scores[index] = 3.0
+        return scores
+
+    def budget(self, word: str) -> int:
+        if len(word) < 4:
+            return 0
+        return min(1 if len(word) <= 5 else 2, self.typos)
+
+    def typo(self, word: str) -> dict[int, int]:
+        """Fewest typos between ``word`` and a word of every name within the budget."""
+        limit = self.budget(word)
+        found: dict[int, int] = {}
+        if not limit:
+            return found
+        for token, owners in self.words.items():
+            typos = distance(word, token, limit, prefix=True)
+            if typos > limit:
+                continue
+            for index in owners:
+                found[index] = min(found.get(index, typos), typos)
+        return found
+
+    def fuzzy(self, query: str) -> dict[int, float]:
+        totals: dict[int, int] | None = None
+        for word in query.split():
+            found = self.typo(word)
+            if totals is None:
+                totals = found
+            else:
+                totals = {index: typos + found[index] for index, typos in totals.items() if index in found}
+        return {index: 1.0 + 1.0 / (1 + typos) for index, typos in (totals or {}).items()}
+
+    def search(self, query: str, limit: int = 8) -> list[str]:
+        query = self.normalize(query)
+        if not query:
+            return list(self.names[:limit])
+        first, *rest = query.split()
+        scores = self.prefix(first)
+        if rest:
+            scores = {index: score for index, score in scores.items() if query in self.folded[index]}
+            for index in scores:
+                if self.folded[index] == query:
+                    scores[index] = 4.0
+                else:
+                    scores[index] = 3.0 if self.folded[index].startswith(query) else 2.0
+        if len(scores) < limit:
+            for index, score in self.fuzzy(query).items():
+                scores.setdefault(index, score)
+        ranked = sorted(scores, key=lambda index: (-scores[index], len(self.names[index]), self.folded[index]))
+        return [self.names[index] for index in ranked[:limit]]
@@ -0,0 +1,72 @@
+import math
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Mapping
+
+__all__: tuple[str, ...] = (
+    "TableModel",
+    "natural",
+)
+
+Key = Callable[[Any], Any]
+
+
+def natural(value: Any) -> tuple[int, Any] | None:
+    """Sort key ordering numbers numerically before text, case insensitively; ``None`` means a missing value."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return 0, value
+    return 1, str(value).casefold()
+
+
+class TableModel:
+    """Sorting and pagination over an in-memory list of rows.
+
+    Rows are kept with their original values and sorted through a key per column, :func:`natural` unless ``keys``
+    gives one. Cells whose key is ``None`` always sort last. Views only ever receive the rows of the current page.
+    """
+
+    def __init__(self, page_size: int = 100, keys: Mapping[int, Key] | None = None) -> None:
+        self.page_size = page_size
+        self.keys = dict(keys or {})
+        self.rows: list[tuple[Any, ...]] = []
+        self.order: list[tuple[Any, ...]] = []
+        self.column: int | None = None
+        self.reverse = False
+        self.page = 0
+
+    def load(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        self.rows = list(rows)
+        self.order = self.rows
+        self.column = None
+        self.reverse = False
+        self.page = 0
+        return None
+
+    def sort(self, column: int, reverse: bool | None = None) -> None:
+        """Sort by ``column``, sorting the same column again flips the direction."""
+        if reverse is None:
+            reverse = not self.reverse if column == self.column else False
+        key = self.keys.get(column, natural)
+        cells = [(key(row[column]), row) for row in self.rows]
+        present = sorted((cell for cell in cells if cell[0] is not None), key=itemgetter(0), reverse=reverse)
+        self.order = [row for _key, row in present] + [row for value, row in cells if value is None]
+        self.column = column
+        self.reverse = reverse
+        self.page = 0
+        return None
+
+    @property
+    def pages(self) -> int:
+        return max(1, math.ceil(len(self.order) / self.page_size))
+
+    def goto(self, page: int) -> int:
+        self.page = max(0, min(page, self.pages - 1))
+        return self.page
+
+    def current(self) -> list[tuple[Any, ...]]:
+        start = self.page * self.page_size
+        return self.order[start : start + self.page_size]
+
+    def __len__(self) -> int:
+        return len(self.rows)
@@ -0,0 +1,170 @@
+import asyncio
+import concurrent.futures
+import inspect
+import itertools
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Hashable
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+if TYPE_CHECKING:
+    from app.api.client import Client
+
+__all__: tuple[str, ...] = (
+    "Priority",
+    "Scheduler",
+    "Task",
+)
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 10
+
+
+@dataclass(eq=False)
+class Task:
+    priority: int
+    work: Callable[[], Any] | Coroutine[Any, Any, Any]
+    owner: object | None = None
+    callback: Callable[[Any], Any] | None = None
+    error: Callable[[BaseException], Any] | None = None
+    key: str | None = None
+    args: Hashable = None
+    generation: int = 0
+    cancelled: bool = False
+    running: asyncio.Future | None = None
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        if self.running is not None:
+            self.running.cancel()
+        elif inspect.iscoroutine(self.work):
+            self.work.close()
+        return None
+
+
+class Scheduler:
+    """App wide task scheduler.
+
+    Work is queued by priority and run by a fixed number of workers on the API client's event loop. Coroutines are
+    awaited directly, plain callables run on a bounded thread pool. Completion callbacks are delivered on the Kivy main
+    thread and are dropped if the task was cancelled in the meantime.
+
+    Tasks submitted with a ``key`` are latest-wins: each ``(owner, key)`` pair tracks a generation token, a new
+    submission cancels the previous one (aborting its request where possible) and only the newest generation is
+    allowed to deliver its result. A submission whose ``args`` equal those of the task still pending for the same pair
+    is not resubmitted, the pending task is kept and delivers to the newest callbacks instead.
+    """
+
+    def __init__(self, client: "Client", workers: int = 4, error: Callable[[BaseException], Any] | None = None) -> None:
+        self.client = client
+        self.workers = workers
+        self.error = error
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agroindia-task")
+        self.tasks: set[Task] = set()
+        self.generations: dict[tuple[int, str], int] = {}
+        self._queue: asyncio.PriorityQueue[tuple[int, int, Task]] | None = None
+        self._counter = itertools.count()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.client.start()
+
+    def submit(
+        self,
+        work: Callable[[], Any] | Coroutine[Any, Any, Any],
+        callback: Callable[[Any], Any] | None = None,
+        error: Callable[[BaseException], Any] | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+        owner: object | None = None,
+        key: str | None = None,
+        args: Hashable = None,
+    ) -> Task:
+        task = Task(priority, work, owner, callback, error or self.error, key, args)
+        if key is not None:
+            previous_tasks = [t for t in self.tasks if t.owner is owner and t.key == key]
+            if args is not None and (same := next((t for t in previous_tasks if t.args == args), None)) is not None:
+                # a repeated tap for the same query keeps the request that is already in flight
+                if inspect.iscoroutine(work):
+                    work.close()
+                same.callback, same.error = callback, error or self.error
+                return same
+            for previous in previous_tasks:
+                previous.cancelled = True
+                self.tasks.discard(previous)
+                self.loop.call_soon_threadsafe(previous.cancel)
+            task.generation = self.generations[(id(owner), key)] = self.generations.get((id(owner), key), 0) + 1
+        self.tasks.add(task)
+        self.loop.call_soon_threadsafe(self._put, task)
+        return task
+
+    def cancel(self, owner: object) -> int:
+        """Cancel every pending or running task submitted on behalf of ``owner``."""
+        tasks = [task for task in self.tasks if task.owner is owner]
+        for task in tasks:
+            task.cancelled = True
+            self.tasks.discard(task)
+            self.loop.call_soon_threadsafe(task.cancel)
+        return len(tasks)
+
+    def _put(self, task: Task) -> None:
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+            for _ in range(self.workers):
+                asyncio.ensure_future(self._worker())
+        self._queue.put_nowait((task.priority, next(self._counter), task))
+        return None
+
+    async def _run(self, work: Callable[[], Any] | Coroutine[Any, Any, Any]) -> Any:
+        if inspect.iscoroutine(work):
+            return await work
+        return await asyncio.get_running_loop().run_in_executor(self.executor, work)  # type: ignore
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            _priority, _sequence, task = await self._queue.get()
+            if task.cancelled:
+                continue
+            task.running = asyncio.ensure_future(self._run(task.work))
+            try:
+                result = await task.running
+            except asyncio.CancelledError as e:
+                # only a cancelled task is dropped silently, the work itself raising it is a failure like any other
+                if not task.cancelled:
+                    Clock.schedule_once(lambda _dt, t=task, exc=e: self._fail(t, exc))
+            except Exception as e:
+                Clock.schedule_once(lambda _dt, t=task, exc=e: self._fail(t, exc))
+            else:
+                Clock.schedule_once(lambda _dt, t=task, res=result: self._done(t, res))
+
+    def current(self, task: Task) -> bool:
+        if task.cancelled:
+            return False
+        return task.key is None or self.generations.get((id(task.owner), task.key)) == task.generation
+
+    def _done(self, task: Task, result: Any) -> None:
+        self.tasks.discard(task)
+        if self.current(task) and task.callback is not None:
+            task.callback(result)
+        return None
+
+    def _fail(self, task: Task, exception: BaseException) -> None:
+        self.tasks.discard(task)
+        if not self.current(task):
+            return None
+        if task.error is None:
+            Logger.exception(exception)
+            return None
+        task.error(exception)
+        return None
+
+    def shutdown(self) -> None:
+        for task in list(self.tasks):
+            task.cancelled = True
+        self.tasks.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        return None
@@ -0,0 +1,239 @@
+import json
+import pathlib
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from deep_translator import GoogleTranslator
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+from .tasks import Priority, Scheduler
+
+if TYPE_CHECKING:
+    import sqlite3
+
+__all__: tuple[str, ...] = (
+    "BUNDLES",
+    "TranslationStore",
+    "Translator",
+    "read_bundle",
+    "translate_batch",
+)
+
+BUNDLES: pathlib.Path = pathlib.Path(__file__).parents[1] / "assets" / "translations"
+LIMIT: int = 4500
+
+
+def read_bundle(path: pathlib.Path) -> dict[str, Any]:
+    try:
+        with path.open(encoding="utf-8") as file:
+            bundle = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return bundle if isinstance(bundle, dict) else {}
+
+
+def chunks(texts: Iterable[str], limit: int = LIMIT) -> Iterator[list[str]]:
+    # single line texts are joined into one request per chunk, multi line texts have to go on their own
+    chunk: list[str] = []
+    size = 0
+    for text in texts:
+        if "\n" in text:
+            yield [text]
+            continue
+        if chunk and size + len(text) + 1 > limit:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(text)
+        size += len(text) + 1
+    if chunk:
+        yield chunk
+
+
+def translate_batch(lang: str, texts: Iterable[str]) -> dict[str, str]:
+    """Translate ``texts`` to ``lang`` with one request per chunk of up to :data:`LIMIT` characters.
+
+    Blocks on the network, call it from a worker thread.
+    """
+    translator = GoogleTranslator(source="auto", target=lang)
+    result: dict[str, str] = {}
+    for chunk in chunks(texts):
+        lines = (translator.translate("\n".join(chunk)) or "").split("\n") if len(chunk) > 1 else []
+        if len(lines) == len(chunk):
+            result.update(zip(chunk, (line.strip() or text for line, text in zip(lines, chunk))))
+        else:
+            result.update((text, translator.translate(text) or text) for text in chunk)
+    return result
+
+
+class TranslationStore:
+    """Runtime translations backed by SQLite.
+
+    Lookups are primary key reads and the file is opened lazily, so startup does not depend on how many strings are
+    stored. Every write is its own synchronous transaction and survives a crash. A ``legacy`` JSON cache is imported
+    once and removed.
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS translations (
+            lang TEXT NOT NULL,
+            text TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (lang, text)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(self, path: pathlib.Path, legacy: pathlib.Path | None = None) -> None:
+        self.path = path
+        self.legacy = legacy
+        self._db: "sqlite3.Connection | None" = None
+        self._lock = threading.Lock()
+
+    @property
+    def db(self) -> "sqlite3.Connection":
+        if self._db is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=FULL")
+            with self._db:
+                self._db.execute(self.SCHEMA)
+            if self.legacy is not None and self.legacy.exists():
+                self.migrate(self.legacy)
+        return self._db
+
+    def migrate(self, legacy: pathlib.Path) -> None:
+        assert self._db is not None
+        rows = [
+            (lang, text, value)
+            for lang, strings in read_bundle(legacy).items()
+            if isinstance(strings, dict)
+            for text, value in strings.items()
+            if value
+        ]
+        with self._db:
+            self._db.executemany("INSERT OR IGNORE INTO translations VALUES (?, ?, ?)", rows)
+        legacy.unlink()
+        print(f"🔃 Migrated {len(rows)} translations from {legacy.name}")
+        return None
+
+    def get(self, lang: str, text: str) -> str | None:
+        with self._lock:
+            row = self.db.execute("SELECT value FROM translations WHERE lang = ? AND text = ?", (lang, text)).fetchone()
+        return None if row is None else str(row[0])
+
+    def items(self, lang: str) -> dict[str, str]:
+        with self._lock:
+            rows = self.db.execute("SELECT text, value FROM translations WHERE lang = ?", (lang,)).fetchall()
+        return dict(rows)
+
+    def update(self, lang: str, strings: dict[str, str]) -> None:
+        with self._lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                [(lang, text, value) for text, value in strings.items()],
+            )
+        return None
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        return None
+
+
+class Translator:
+    """Non blocking translation of UI strings.
+
+    Lookups go through the pre-warmed bundle shipped for the language, then a bounded LRU in front of the ``store`` of
+    strings translated at runtime. Misses return the source text immediately and are queued; every miss of the same
+    frame is sent as a single batch on a background worker, written to the store as soon as it lands and ``ready`` is
+    called on the main thread so views can redraw.
+    """
+
+    def __init__(
+        self,
+        store: TranslationStore,
+        tasks: Scheduler,
+        ready: Callable[[], Any] | None = None,
+        maxsize: int = 1024,
+        bundles: pathlib.Path = BUNDLES,
+    ) -> None:
+        self.store = store
+        self.tasks = tasks
+        self.ready = ready
+        self.maxsize = maxsize
+        self.directory = bundles
+        self.bundles: dict[str, dict[str, str]] = {}
+        self.cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.pending: dict[str, set[str]] = {}
+        self.inflight: set[tuple[str, str]] = set()
+        self.trigger = Clock.create_trigger(self.flush)
+
+    def bundle(self, lang: str) -> dict[str, str]:
+        if lang not in self.bundles:
+            self.bundles[lang] = read_bundle(self.directory / f"{lang}.json")
+        return self.bundles[lang]
+
+    def put(self, lang: str, text: str, translated: str) -> None:
+        self.cache[(lang, text)] = translated
+        self.cache.move_to_end((lang, text))
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return None
+
+    def get(self, text: str, lang: str) -> str:
+        if lang == "en" or not text.strip():
+            return text
+        bundled = self.bundle(lang).get(text)
+        if bundled:
+            return bundled
+        key = (lang, text)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        stored = self.store.get(lang, text)
+        if stored is not None:
+            self.put(lang, text, stored)
+            return stored
+        if key not in self.inflight:
+            self.pending.setdefault(lang, set()).add(text)
+            self.trigger()
+        return text
+
+    def flush(self, *_args: Any) -> None:
+        pending, self.pending = self.pending, {}
+        for lang, texts in pending.items():
+            batch = sorted(texts)
+            self.inflight.update((lang, text) for text in batch)
+            self.tasks.submit(
+                partial(self.fetch, lang, batch),
+                callback=partial(self.land, lang, batch),
+                error=partial(self.drop, lang, batch),
+                priority=Priority.BACKGROUND,
+            )
+        return None
+
+    def fetch(self, lang: str, batch: list[str]) -> dict[str, str]:
+        result = translate_batch(lang, batch)
+        self.store.update(lang, result)
+        return result
+
+    def land(self, lang: str, batch: list[str], result: dict[str, str]) -> None:
+        self.inflight.difference_update((lang, text) for text in batch)
+        for text, translated in result.items():
+            self.put(lang, text, translated)
+        print(f"✅ Translated {len(result)} strings to {lang}")
+        if self.ready is not None:
+            self.ready()
+        return None
+
+    def drop(self, lang: str, batch: list[str], exception: BaseException) -> None:
+        # the source text stays on screen, the strings are retried the next time they are looked up
+        self.inflight.difference_update((lang, text) for text in batch)
+        Logger.warning(f"Translator: {len(batch)} strings to {lang} failed: {exception!r}")
+        return None
@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from kivy.core.window import Window
 from kivy.factory import Factory
-from kivy.garden.matplotlib import FigureCanvasKivyAgg
 from kivy.properties import BooleanProperty, ListProperty, NumericProperty, ObjectProperty
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
@@ -17,21 +16,12 @@ from kivymd.uix.button import (
 from kivymd.uix.card import MDCard
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.label import MDIcon, MDLabel
-from kivymd.uix.swiper import MDSwiperItem
+from kivymd.uix.swiper import MDSwiper, MDSwiperItem
 
 if TYPE_CHECKING:
     from app import AgroIndia
 
 
-class Plot(FigureCanvasKivyAgg, MDSwiperItem):
-    """Plot widget for matplotlib plots."""
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self.pos_hint = {"center_x": 0.5, "center_y": 0.5}
-        self.size_hint = (0.9, 0.9)
-
-
 class BlockLabel(Label):
     scale_factor = 0.9
     factor: list[float] = ListProperty()
@@ -128,11 +118,51 @@ class ShadowCard(MDCard, RoundedRectangularElevationBehavior):
     pass
 
 
+class RecycleSwiper(MDSwiper):
+    """Swiper that only materializes the selected item and its neighbours.
+
+    ``data`` may be arbitrarily long, a fixed pool of at most ``2 * neighbours + 1`` items created by ``viewclass`` is
+    reused and rebound to the visible window of ``data`` as the user swipes. Items must implement ``bind_data(value)``.
+    """
+
+    data: list[Any] = ListProperty()
+    neighbours: int = NumericProperty(1)
+    viewclass: Callable[[], MDSwiperItem] = ObjectProperty()
+    index: int = 0
+    start: int = 0
+
+    def on_data(self, _instance: "RecycleSwiper", _data: list[Any]) -> None:
+        self.refresh(0)
+        return None
+
+    def refresh(self, index: int | None = None) -> None:
+        """Rebind the pool so that ``data[index]`` is the selected item."""
+        size = min(len(self.data), 2 * int(self.neighbours) + 1)
+        items = self.get_items()
+        for item in items[size:]:
+            super().remove_widget(item)
+        for _ in range(len(items), size):
+            self.add_widget(self.viewclass())
+        if not size:
+            self.index = self.start = 0
+            return None
+        self.index = max(0, min(self.index if index is None else index, len(self.data) - 1))
+        self.start = max(0, min(self.index - int(self.neighbours), len(self.data) - size))
+        for offset, item in enumerate(self.get_items()):
+            item.bind_data(self.data[self.start + offset])
+        super().set_current(self.index - self.start)
+        return None
+
+    def set_current(self, index: int) -> None:
+        # swipe_left / swipe_right work on pool positions, translate them to data positions
+        return self.refresh(self.start + index)
+
+
 class Report(MDSwiperItem, NewShadowWidget):
-    def __init__(self, data: dict[str, Any], app: "AgroIndia", **kwargs: Any) -> None:
+    def __init__(self, data: dict[str, Any] | None, app: "AgroIndia", **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.app = app
-        self.data = data
+        self.data: dict[str, str] = {}
         self.elevation = 10
         self.orientation = "vertical"
         self.size_hint = (None, None)
@@ -142,84 +172,66 @@ class Report(MDSwiperItem, NewShadowWidget):
         self.hard_shadow_cl = self.app.theme_cls.accent_color
         self.md_bg_color = self.app.theme_cls.accent_color
         self.set_card()
+        if data is not None:
+            self.bind_data(data)
+        app.bind(revision=self.retranslate)
+
+    def stringify(self, data: dict[str, Any]) -> dict[str, str]:
+        return {k: str(v) for k, v in data.items()}
+
+    def bind_data(self, data: dict[str, Any]) -> None:
+        self.data = self.stringify(data)
+        self.time.text = self.data["datetime"]
+        self.icon.source = f"app/assets/images/icons/{self.data['icon']}.png"
+        self.description.text = self.data.get("description", self.data["conditions"])
+        self.temperature.text = f"{self.app.translate('Temperature')}:\n {self.data['temp']}°C"
+        self.humidity.text = f"{self.app.translate('Humidity')}:\n {self.data['humidity']} %"
+        self.wind.text = f"{self.app.translate('Wind')}\n{self.app.translate('Speed')}:\n {self.data['windspeed']} km/h"
+        self.pressure.text = f"{self.app.translate('Pressure')}:\n {self.data['pressure']} hPa"
+        return None
 
-    def stringify(self) -> None:
-        self.data = {k: str(v) for k, v in self.data.items()}
+    def retranslate(self, *_args: Any) -> None:
+        if self.data:
+            self.bind_data(self.data)
+        return None
 
     def set_card(self) -> None:
-        self.stringify()
         box = MDBoxLayout(orientation="vertical", size_hint=(None, None), size=(300, 420))
         smol_box = MDBoxLayout(orientation="horizontal", size_hint=(None, None), spacing=10, padding=10)
         smol_box.add_widget(MDIcon(icon="clock", size_hint=(None, None), size=(30, 30), pos_hint={"top": 1}))
-        smol_box.add_widget(
-            MDLabel(
-                text=self.data["datetime"],
-                font_style="H4",
-                bold=True,
-                pos_hint={"top": 1},
-                size_hint=(None, None),
-                size=(200, 30),
-            )
-        )
+        self.time = MDLabel(font_style="H4", bold=True, pos_hint={"top": 1}, size_hint=(None, None), size=(200, 30))
+        smol_box.add_widget(self.time)
         box.add_widget(smol_box)
-        box.add_widget(
-            FitImage(
-                source=f"app/assets/images/icons/{self.data['icon']}.png",
-                size_hint=(None, None),
-                pos_hint={"top": 1},
-                size=(75, 75),
-            )
-        )
-        box.add_widget(
-            MDLabel(
-                text=self.data.get("description", self.data["conditions"]),
-                pos_hint={"top": 1},
-                halign="center",
-                font_style="H6",
-                valign="top",
-                italic=True,
-                font_size=20,
-            )
+        self.icon = FitImage(size_hint=(None, None), pos_hint={"top": 1}, size=(75, 75))
+        box.add_widget(self.icon)
+        self.description = MDLabel(
+            pos_hint={"top": 1},
+            halign="center",
+            font_style="H6",
+            valign="top",
+            italic=True,
+            font_size=20,
         )
+        box.add_widget(self.description)
         smol_box = MDBoxLayout(orientation="horizontal", size_hint=(None, None), spacing=10, padding=10)
-        smol_box.add_widget(
-            MDFillRoundFlatIconButton(
-                text=f"{self.app.translate('Temperature')}:\n {self.data['temp']}°C",
-                font_style="H6",
-                pos_hint={"top": 1, "left": 1},
-                icon="thermometer-lines",
-                font_name=self.app.font_regular,
-            )
-        )
-        smol_box.add_widget(
-            MDFillRoundFlatIconButton(
-                text=f"{self.app.translate('Humidity')}:\n {self.data['humidity']} %",
-                font_style="H6",
-                pos_hint={"top": 1, "left": 1},
-                icon="water-percent",
-                font_name=self.app.font_regular,
-            )
-        )
+        self.temperature = self.stat("thermometer-lines")
+        self.humidity = self.stat("water-percent")
+        smol_box.add_widget(self.temperature)
+        smol_box.add_widget(self.humidity)
         box.add_widget(smol_box)
         smol_box = MDBoxLayout(orientation="horizontal", size_hint=(None, None), spacing=10, padding=10)
-        smol_box.add_widget(
-            MDFillRoundFlatIconButton(
-                text=f"{self.app.translate('Wind')}\n{self.app.translate('Speed')}:\n {self.data['windspeed']} km/h",
-                font_style="H6",
-                pos_hint={"top": 1, "left": 1},
-                icon="weather-windy",
-                font_name=self.app.font_regular,
-            )
-        )
-        smol_box.add_widget(
-            MDFillRoundFlatIconButton(
-                text=f"{self.app.translate('Pressure')}:\n {self.data['pressure']} hPa",
-                font_style="H6",
-                pos_hint={"top": 1, "left": 1},
-                icon="gauge",
-                font_name=self.app.font_regular,
-            )
-        )
+        self.wind = self.stat("weather-windy")
+        self.pressure = self.stat("gauge")
+        smol_box.add_widget(self.wind)
+        smol_box.add_widget(self.pressure)
         box.add_widget(smol_box)
         self.add_widget(box)
         return None
+
+    def stat(self, icon: str) -> MDFillRoundFlatIconButton:
+        return MDFillRoundFlatIconButton(
+            font_style="H6",
+            pos_hint={"top": 1, "left": 1},
+            icon=icon,
+            font_name=self.app.font_regular,
+        )
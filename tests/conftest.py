@@ -0,0 +1,5 @@
+import os
+
+# kivy would otherwise parse pytest's command line and log to the console on import
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
@@ -0,0 +1,110 @@
+import dataclasses
+import itertools
+import json
+import pathlib
+from typing import Any, Iterator
+
+import pytest
+
+from app.api import PriceFrame, Prices, PriceSnapshot
+from app.api.client import Client, Response
+from app.api.prices import Price
+
+STATES: dict[str, dict[str, tuple[str, ...]]] = {
+    "Punjab": {"Ludhiana": ("Khanna", "Jagraon"), "Amritsar": ("Ajnala",)},
+    "Kerala": {"Kollam": ("Punalur",), "Ernakulam": ("Aluva", "Perumbavoor")},
+}
+COMMODITIES: tuple[str, ...] = ("Wheat", "Rice", "Onion", "onion")
+
+
+def records() -> list[Prices]:
+    rows = []
+    locations = [
+        (state, district, market)
+        for state, districts in STATES.items()
+        for district, markets in districts.items()
+        for market in markets
+    ]
+    for number, ((state, district, market), commodity) in enumerate(itertools.product(locations, COMMODITIES), 1):
+        modal = 900 + (number * 37) % 400
+        rows.append(
+            Prices(
+                number,
+                state,
+                district,
+                market,
+                commodity,
+                "Other",
+                f"{number % 28 + 1:02d}/03/2023",
+                modal - 50,
+                modal + 50,
+                modal,
+            )
+        )
+    return rows
+
+
+@pytest.fixture()
+def snapshot(tmp_path: pathlib.Path) -> Iterator[PriceSnapshot]:
+    snapshot = PriceSnapshot(tmp_path / "prices.db")
+    snapshot.merge(records())
+    yield snapshot
+    snapshot.close()
+
+
+# (broad query the frame was fetched with, narrower query refined locally) in the order of ``Price.get_vars``
+REFINEMENTS: list[tuple[tuple, tuple]] = [
+    (("", "", "", "", "", "", ""), ("", "Punjab", "", "", "", "", "")),
+    (("", "Punjab", "", "", "", "", ""), ("", "Punjab", "Ludhiana", "", "", "", "")),
+    (("", "Punjab", "Ludhiana", "", "", "", ""), ("", "Punjab", "Ludhiana", "Khanna", "Wheat", "", "")),
+    (("", "Kerala", "", "", "", "", ""), ("", "Kerala", "", "", "Onion", "", "")),
+    (("", "", "", "", "Onion", "", ""), ("", "Kerala", "Ernakulam", "", "Onion", "1000", "")),
+    (("", "", "", "", "", "", ""), ("", "", "", "", "", "1000", "1100")),
+    (("", "", "", "", "", "", ""), ("", "", "", "", "", "", "950")),
+    (("", "", "", "", "", "", ""), ("7", "", "", "", "", "", "")),
+    (("", "Kerala", "", "", "", "", ""), ("7", "Kerala", "", "", "", "", "")),
+    (("", "Kerala", "", "", "", "", ""), ("", "Kerala", "Ludhiana", "", "", "", "")),
+]
+
+
+@pytest.mark.parametrize("broad, narrow", REFINEMENTS)
+def test_refinement_matches_query(snapshot: PriceSnapshot, broad: tuple, narrow: tuple) -> None:
+    frame = PriceFrame.from_records(snapshot.query(*broad))
+    assert frame.filter(*narrow).records() == snapshot.query(*narrow)
+
+
+def test_complete_pull_drops_removed_rows(snapshot: PriceSnapshot) -> None:
+    kept = records()[:-3]
+    assert snapshot.merge(kept) == 3
+    assert snapshot.complete
+    assert snapshot.query() == sorted(kept, key=lambda row: (row.MODAL_PRICE, row.ID))
+    snapshot.merge(kept[:5], complete=False)
+    assert not snapshot.complete
+    assert len(snapshot) == len(kept)
+
+
+class Pages(Client):
+    """Serves ``rows`` as ``prices/filter`` pages of ``size`` rows, or the first page for every page if ``capped``."""
+
+    def __init__(self, rows: list[Prices], size: int, capped: bool = False) -> None:
+        super().__init__()
+        self.rows = [dataclasses.asdict(row) for row in rows]
+        self.size = size
+        self.capped = capped
+
+    def get(self, url: str, params: dict[str, Any] | None = None, cache: bool = True) -> Response:
+        start = 0 if self.capped else (int((params or {})["page"]) - 1) * self.size
+        return Response(200, json.dumps(self.rows[start : start + self.size]))
+
+
+def test_paged_pull_is_complete(snapshot: PriceSnapshot) -> None:
+    kept = records()[:-3]
+    Price(Pages(kept, 10), "").pull(snapshot, force=True)
+    assert snapshot.complete
+    assert len(snapshot) == len(kept)
+
+
+def test_repeated_page_leaves_pull_incomplete(snapshot: PriceSnapshot) -> None:
+    Price(Pages(records(), 10, capped=True), "").pull(snapshot, force=True)
+    assert not snapshot.complete
+    assert len(snapshot) == len(records())